@@ -5,7 +5,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from .models import (
     DatasetSummaryResponse,
@@ -18,22 +20,37 @@ from .models import (
     SnapshotListResponse,
     SettingsResponse,
 )
-from .services import GroupFilters, TransactionFilters, get_service
+from .responses import ORJSONResponse, conditional_response
+from .services import DEFAULT_SNAPSHOT_LIMIT, GroupFilters, GroupService, TransactionFilters, get_service
 
-router = APIRouter(prefix="/api")
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
 
+# Routes return responses directly so FastAPI neither validates nor runs
+# jsonable_encoder on the way out; ``responses=`` keeps the schemas in /docs.
+# Payloads that only change on refresh are served with an ETag.
 
-@router.get("/settings", response_model=SettingsResponse)
-def read_settings() -> SettingsResponse:
-    return get_service().get_settings()
 
+async def provide_service() -> GroupService:
+    """Dependency returning the process-wide service.
 
-@router.get("/summary", response_model=DatasetSummaryResponse)
-def read_summary() -> DatasetSummaryResponse:
-    return get_service().get_dataset_summary()
+    Declared ``async`` so FastAPI awaits it inline instead of dispatching a
+    sync dependency to the threadpool on every request.
+    """
 
+    return get_service()
 
-@router.get("/groups", response_model=GroupListResponse)
+
+@router.get("/settings", responses={200: {"model": SettingsResponse}})
+def read_settings(request: Request, service: GroupService = Depends(provide_service)) -> Response:
+    return conditional_response(request, service.get_settings_encoded())
+
+
+@router.get("/summary", responses={200: {"model": DatasetSummaryResponse}})
+def read_summary(request: Request, service: GroupService = Depends(provide_service)) -> Response:
+    return conditional_response(request, service.get_dataset_summary_encoded())
+
+
+@router.get("/groups", responses={200: {"model": GroupListResponse}})
 def list_groups(
     min_risk: int = Query(0, ge=0, le=100),
     min_total: float = Query(0.0, ge=0.0),
@@ -41,7 +58,8 @@ def list_groups(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     reported_only: bool = Query(False),
-) -> GroupListResponse:
+    service: GroupService = Depends(provide_service),
+) -> Response:
     filters = GroupFilters(
         min_risk=min_risk,
         min_total=min_total,
@@ -50,17 +68,18 @@ def list_groups(
         end_date=end_date,
         reported_only=reported_only,
     )
-    return get_service().list_groups(filters)
+    return Response(service.list_groups(filters), media_type="application/json")
 
 
-@router.get("/groups/{group_id}", response_model=GroupDetailResponse)
+@router.get("/groups/{group_id}", responses={200: {"model": GroupDetailResponse}})
 def read_group(
     group_id: str,
     min_amount: float = Query(0.0, ge=0.0),
     max_amount: float = Query(float("inf"), ge=0.0),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-) -> GroupDetailResponse:
+    service: GroupService = Depends(provide_service),
+) -> ORJSONResponse:
     filters = TransactionFilters(
         min_amount=min_amount,
         max_amount=max_amount,
@@ -68,12 +87,13 @@ def read_group(
         end_date=end_date,
     )
     try:
-        return get_service().get_group_detail(group_id, transaction_filters=filters)
+        detail = service.get_group_detail(group_id, transaction_filters=filters)
     except ValueError as exc:  # pragma: no cover - thin wrapper
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return ORJSONResponse(detail)
 
 
-@router.get("/network", response_model=NetworkResponse)
+@router.get("/network", responses={200: {"model": NetworkResponse}})
 def read_network(
     min_risk: int = Query(0, ge=0, le=100),
     min_total: float = Query(0.0, ge=0.0),
@@ -82,7 +102,8 @@ def read_network(
     end_date: Optional[datetime] = Query(None),
     reported_only: bool = Query(False),
     highlight_reported: bool = Query(True),
-) -> NetworkResponse:
+    service: GroupService = Depends(provide_service),
+) -> Response:
     filters = GroupFilters(
         min_risk=min_risk,
         min_total=min_total,
@@ -91,27 +112,36 @@ def read_network(
         end_date=end_date,
         reported_only=reported_only,
     )
-    return get_service().get_network(filters, highlight_reported=highlight_reported)
+    network = service.get_network(filters, highlight_reported=highlight_reported)
+    return StreamingResponse(network, media_type="application/json")
 
 
-@router.get("/reports", response_model=list[ReportRecord])
-def read_reports() -> list[ReportRecord]:
-    return get_service().list_reports()
+@router.get("/reports", responses={200: {"model": list[ReportRecord]}})
+def read_reports(service: GroupService = Depends(provide_service)) -> ORJSONResponse:
+    return ORJSONResponse(service.list_reports())
 
 
-@router.post("/reports", response_model=ReportCreateResponse)
-def create_report(request: ReportCreateRequest) -> ReportCreateResponse:
+@router.post("/reports", responses={200: {"model": ReportCreateResponse}})
+async def create_report(
+    request: ReportCreateRequest,
+    service: GroupService = Depends(provide_service),
+) -> ORJSONResponse:
     try:
-        return get_service().submit_report(request)
+        created = await run_in_threadpool(service.submit_report, request)
     except ValueError as exc:  # pragma: no cover - thin wrapper
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ORJSONResponse(created)
 
 
-@router.get("/snapshots", response_model=SnapshotListResponse)
-def read_snapshots(limit: int = Query(100, ge=1, le=1000)) -> SnapshotListResponse:
-    return get_service().list_snapshots(limit=limit)
+@router.get("/snapshots", responses={200: {"model": SnapshotListResponse}})
+def read_snapshots(
+    request: Request,
+    limit: int = Query(DEFAULT_SNAPSHOT_LIMIT, ge=1, le=1000),
+    service: GroupService = Depends(provide_service),
+) -> Response:
+    return conditional_response(request, service.list_snapshots_encoded(limit=limit))
 
 
 @router.post("/actions/refresh", status_code=204)
-def refresh_caches() -> None:
-    get_service().refresh()
+async def refresh_caches(service: GroupService = Depends(provide_service)) -> None:
+    await service.refresh_async()
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +21,21 @@ DEFAULT_REPORT_CHECKS = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppPaths:
     """Resolved filesystem locations used by the service."""
 
     base_dir: Path
     artifacts_dir: Path
     entities_dir: Path
+    enriched_cache_file: Path
     summary_file: Path
     snapshots_file: Path
     reports_file: Path
     settings_file: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """Runtime configurable settings sourced from JSON."""
 
@@ -51,7 +52,7 @@ class AppSettings:
         highlight = bool(ui.get("defaultHighlightReported", True))
         show_summaries = bool(ui.get("defaultShowSummaries", True))
         raw_checks = reporting.get("checks") if isinstance(reporting, dict) else None
-        if isinstance(raw_checks, list) and all(isinstance(item, str) for item in raw_checks):
+        if isinstance(raw_checks, list) and all(item.__class__ is str for item in raw_checks):
             checks = [item.strip() for item in raw_checks if item.strip()]
             if not checks:
                 checks = DEFAULT_REPORT_CHECKS
@@ -65,7 +66,7 @@ class AppSettings:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Aggregated application configuration."""
 
@@ -84,30 +85,56 @@ def _resolve_base_dir() -> Path:
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists() or path.stat().st_size == 0:
+    try:
+        if os.stat(path).st_size == 0:
+            return {}
+    except OSError:
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))  # type: ignore[return-value]
-    except json.JSONDecodeError:
+        return orjson.loads(path.read_bytes())  # type: ignore[return-value]
+    except orjson.JSONDecodeError:
         logger.warning("Unable to parse JSON settings file at %s", path)
         return {}
 
 
-@lru_cache(maxsize=1)
-def get_config() -> AppConfig:
-    """Return the memoised application configuration."""
+_CONFIG: Optional[AppConfig] = None
 
+
+def _build_config() -> AppConfig:
     base_dir = _resolve_base_dir()
     artifacts_dir = base_dir / "artifacts"
+    # Prefer a JSONL snapshot export: listing it only needs to parse the lines it returns.
+    snapshots_file = artifacts_dir / "snapshots.jsonl"
+    if not snapshots_file.exists():
+        snapshots_file = artifacts_dir / "snapshots.json"
+    entities_dir = artifacts_dir / "entities"
     paths = AppPaths(
         base_dir=base_dir,
         artifacts_dir=artifacts_dir,
-        entities_dir=artifacts_dir / "entities",
+        entities_dir=entities_dir,
+        enriched_cache_file=entities_dir / ".enriched.pkl",
         summary_file=artifacts_dir / "summary.json",
-        snapshots_file=artifacts_dir / "snapshots.json",
-        reports_file=base_dir / "reports.json",
+        snapshots_file=snapshots_file,
+        reports_file=base_dir / "reports.jsonl",
         settings_file=base_dir / "config" / "app_settings.json",
     )
     settings_payload = _load_json(paths.settings_file)
     settings = AppSettings.from_payload(settings_payload)
     return AppConfig(paths=paths, settings=settings)
+
+
+def init_config() -> AppConfig:
+    """Load the configuration and install it as the process-wide instance."""
+
+    global _CONFIG
+    _CONFIG = _build_config()
+    return _CONFIG
+
+
+def get_config() -> AppConfig:
+    """Return the configuration loaded at startup, loading it on first use."""
+
+    config = _CONFIG
+    if config is None:
+        config = init_config()
+    return config
@@ -2,22 +2,51 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import mmap
+import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: no cross-process lock, writes stay atomic
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+_from_iso = datetime.fromisoformat
+# Python 3.11+ accepts a trailing "Z" natively; older versions need "+00:00".
+_NEEDS_ZULU_REWRITE = sys.version_info < (3, 11)
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_THRESHOLD = 64 * 1024
+
+T = TypeVar("T")
+
 
+@lru_cache(maxsize=65536)
 def parse_iso_datetime(raw: Optional[str]) -> Optional[datetime]:
-    """Return a timezone-aware datetime if the value can be parsed."""
+    """Return a timezone-aware datetime if the value can be parsed.
+
+    Results are memoised because transaction timestamps repeat heavily across
+    an artifact set; the returned datetimes are immutable so sharing is safe.
+    """
 
     if not raw:
         return None
+    if _NEEDS_ZULU_REWRITE and raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
     try:
-        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        parsed = _from_iso(raw)
         if parsed.tzinfo is None:
             return parsed.replace(tzinfo=timezone.utc)
         return parsed
@@ -27,25 +56,75 @@ def parse_iso_datetime(raw: Optional[str]) -> Optional[datetime]:
 
 
 def _safe_read_json(path: Path) -> Optional[Any]:
-    if not path.exists() or path.stat().st_size == 0:
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        size = 0
+    if size == 0:
         logger.debug("Skipping empty or missing file at %s", path)
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        if size < _MMAP_THRESHOLD:
+            return orjson.loads(path.read_bytes())
+        # Parse large files straight from the page cache instead of copying them.
+        with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+    except orjson.JSONDecodeError:
         logger.warning("Unable to parse JSON payload from %s", path)
         return None
 
 
+def _read_group_payload(path: Path) -> Tuple[Path, Optional[Any]]:
+    return path, _safe_read_json(path)
+
+
+def _list_group_files(directory: Path) -> Optional[List[Path]]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return None
+
+
+def group_files_signature(directory: Path) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    """Fingerprint the group files by name, size and mtime, or ``None`` if the directory is missing."""
+
+    paths = _list_group_files(directory)
+    if paths is None:
+        return None
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        signature.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
 def load_group_payloads(directory: Path) -> List[Dict[str, Any]]:
-    """Load raw group JSON blobs from the artifacts directory."""
+    """Load raw group JSON blobs from the artifacts directory.
+
+    Files are read and parsed on a thread pool; both the read and the orjson
+    parse release the GIL, and ``Executor.map`` keeps the sorted order.
+    """
 
     items: List[Dict[str, Any]] = []
-    if not directory.exists():
+    paths = _list_group_files(directory)
+    if paths is None:
         logger.warning("Group directory %s does not exist", directory)
         return items
-    for path in sorted(directory.glob("*.json")):
-        payload = _safe_read_json(path)
+    if not paths:
+        return items
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_read_group_payload, paths))
+    for path, payload in results:
         if isinstance(payload, dict):
             payload = dict(payload)
             payload["_source_path"] = str(path)
@@ -53,27 +132,148 @@ def load_group_payloads(directory: Path) -> List[Dict[str, Any]]:
     return items
 
 
+@contextmanager
+def _exclusive_lock(path: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    try:
+        handle = open(path, "ab")
+    except OSError:
+        yield
+        return
+    with handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _read_pickle_cache(path: Path, key: Any) -> Optional[Any]:
+    # The key is pickled ahead of the payload so a stale cache is rejected
+    # without unpickling everything behind it.
+    try:
+        with open(path, "rb") as handle:
+            if pickle.load(handle) != key:
+                return None
+            return pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception:  # noqa: BLE001 - any unreadable cache is simply rebuilt
+        logger.warning("Ignoring unreadable cache file %s", path)
+        return None
+
+
+def _write_pickle_cache(path: Path, key: Any, payload: Any) -> None:
+    staging = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(staging, "wb") as handle:
+            pickle.dump(key, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(staging, path)
+    except OSError:
+        logger.warning("Unable to write cache file %s", path)
+        staging.unlink(missing_ok=True)
+
+
+def load_or_build_cache(path: Path, key: Any, build: Callable[[], T]) -> T:
+    """Return the value pickled at ``path`` for ``key``, building and storing it on a miss.
+
+    Processes sharing the file serialise rebuilds on a lock file, so only the
+    first one runs ``build`` and the others load its result.
+    """
+
+    cached = _read_pickle_cache(path, key)
+    if cached is not None:
+        return cached
+    with _exclusive_lock(path.with_name(path.name + ".lock")):
+        cached = _read_pickle_cache(path, key)
+        if cached is not None:
+            return cached
+        value = build()
+        _write_pickle_cache(path, key, value)
+    return value
+
+
 def load_summary(path: Path) -> Dict[str, Any]:
     payload = _safe_read_json(path)
     return payload if isinstance(payload, dict) else {}
 
 
+def _read_lines(path: Path) -> List[bytes]:
+    try:
+        return path.read_bytes().splitlines()
+    except FileNotFoundError:
+        return []
+
+
+def _iter_jsonl(path: Path, lines: Iterable[bytes], kind: str) -> Iterator[Dict[str, Any]]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            logger.warning("Skipping malformed %s on line %d of %s", kind, line_number, path)
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
 def load_snapshots(path: Path) -> List[Dict[str, Any]]:
+    """Load snapshots from a JSON array artifact or a JSONL artifact."""
+
+    if path.suffix == ".jsonl":
+        return list(_iter_jsonl(path, _read_lines(path), "snapshot"))
     payload = _safe_read_json(path)
     return payload if isinstance(payload, list) else []
 
 
+def load_snapshot_page(path: Path, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Return the first ``limit`` snapshots of a JSONL artifact and its record count.
+
+    Records past the page are parsed only to be counted, so the count skips
+    the same malformed and non-object lines as :func:`load_snapshots`.
+    """
+
+    records = _iter_jsonl(path, _read_lines(path), "snapshot")
+    page = list(islice(records, limit))
+    return page, len(page) + sum(1 for _ in records)
+
+
 def load_reports(path: Path) -> List[Dict[str, Any]]:
-    payload = _safe_read_json(path)
-    if isinstance(payload, list):
-        return payload
-    return []
+    """Load recorded reports from a JSONL log (or a legacy JSON array file)."""
 
+    if path.suffix != ".jsonl":
+        payload = _safe_read_json(path)
+        return payload if isinstance(payload, list) else []
+    return list(_iter_jsonl(path, _read_lines(path), "report"))
 
-def write_reports(path: Path, reports: Sequence[Dict[str, Any]]) -> None:
-    path.write_text(json.dumps(list(reports), indent=2), encoding="utf-8")
+
+def append_report(path: Path, record: Dict[str, Any]) -> None:
+    """Append a single report to the JSONL log.
+
+    One small ``write`` on a file opened for append is atomic on POSIX, so
+    concurrent writers cannot interleave partial lines.
+    """
+
+    with open(path, "ab") as handle:
+        handle.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
 
 
 def ensure_reports_file(path: Path) -> None:
-    if not path.exists():
-        path.write_text("[]\n", encoding="utf-8")
+    """Create the reports log, carrying over a legacy ``reports.json`` if present.
+
+    An empty log is seeded the same way, so reports recorded before the
+    switch to JSONL are not hidden behind a freshly created file.
+    """
+
+    try:
+        if path.stat().st_size:
+            return
+    except FileNotFoundError:
+        pass
+    records = load_reports(path.with_suffix(".json")) if path.suffix == ".jsonl" else []
+    if records or not path.exists():
+        path.write_bytes(b"".join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records))
@@ -2,42 +2,47 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
-from fastapi import FastAPI, Response
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 from .api import router
-from .config import get_config
+from .config import init_config
+from .responses import EncodedPayload, ORJSONResponse, conditional_response
+from .services import init_service
+from .static import PrecompressedStaticFiles, precompress_assets
 
 
 def create_app() -> FastAPI:
-    config = get_config()
-    app = FastAPI(title=config.settings.title)
+    config = init_config()
+    init_service(config)
+    app = FastAPI(title=config.settings.title, default_response_class=ORJSONResponse)
     app.include_router(router)
 
     static_root = config.paths.base_dir / "frontend"
     assets_dir = static_root / "assets"
     if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
+        precompress_assets(assets_dir)
+        app.mount("/assets", PrecompressedStaticFiles(directory=assets_dir), name="assets")
     config_dir = config.paths.base_dir / "config"
     if config_dir.exists():
         app.mount("/config", StaticFiles(directory=config_dir), name="config")
 
     index_path = static_root / "index.html"
+    # The shell page is read once; it is only rebuilt alongside a restart.
+    index_page = EncodedPayload.from_body(index_path.read_bytes()) if index_path.exists() else None
 
     @app.get("/", include_in_schema=False)
-    async def root() -> Response:
-        if index_path.exists():
-            return FileResponse(index_path)
+    async def root(request: Request) -> Response:
+        if index_page is not None:
+            return conditional_response(request, index_page, media_type="text/html")
         return RedirectResponse(url="/docs")
 
     @app.get("/ui", include_in_schema=False)
-    async def ui_entrypoint() -> Response:
-        if not index_path.exists():
+    async def ui_entrypoint(request: Request) -> Response:
+        if index_page is None:
             raise FileNotFoundError("UI assets not built")
-        return FileResponse(index_path)
+        return conditional_response(request, index_page, media_type="text/html")
 
     return app
 
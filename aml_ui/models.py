@@ -1,4 +1,11 @@
-"""Pydantic models shared across the FastAPI surface."""
+"""Payload schemas shared across the FastAPI surface.
+
+Outbound payloads are ``TypedDict``s: the service assembles them from data it
+has already normalised and the routes render them with orjson, so nothing is
+validated a second time on the way out. FastAPI still derives the OpenAPI
+schema from them via ``responses=``. Request bodies remain Pydantic models so
+inbound data is validated.
+"""
 
 from __future__ import annotations
 
@@ -6,15 +13,16 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 
-class RunOptionModel(BaseModel):
+class RunOptionModel(TypedDict):
     label: str
     value: str
-    meta: Dict[str, Any] = Field(default_factory=dict)
+    meta: Dict[str, Any]
 
 
-class GroupMetrics(BaseModel):
+class GroupMetrics(TypedDict):
     member_count: int
     transaction_count: int
     total_amount: float
@@ -27,7 +35,7 @@ class GroupMetrics(BaseModel):
     risk_score: int
 
 
-class TransactionModel(BaseModel):
+class TransactionModel(TypedDict):
     transaction_id: Optional[str]
     direction: Optional[str]
     counterparty_id: Optional[str]
@@ -36,30 +44,30 @@ class TransactionModel(BaseModel):
     timestamp: Optional[datetime]
 
 
-class MemberModel(BaseModel):
+class MemberModel(TypedDict):
     record_id: Optional[str]
     entity_type: Optional[str]
-    attributes: Dict[str, Any] = Field(default_factory=dict)
-    normalized_attributes: Dict[str, Any] = Field(default_factory=dict)
-    transactions: List[TransactionModel] = Field(default_factory=list)
-    signature_history: List[str] = Field(default_factory=list)
+    attributes: Dict[str, Any]
+    normalized_attributes: Dict[str, Any]
+    transactions: List[TransactionModel]
+    signature_history: List[str]
 
 
-class GroupSummary(BaseModel):
+class GroupSummary(TypedDict):
     group_id: str
     display_name: Optional[str]
     metrics: GroupMetrics
     source_path: Optional[str]
-    reported: bool = False
+    reported: bool
 
 
 class GroupDetail(GroupSummary):
-    canonical_attributes: Dict[str, Any] = Field(default_factory=dict)
-    members: List[MemberModel] = Field(default_factory=list)
-    transactions: List[TransactionModel] = Field(default_factory=list)
+    canonical_attributes: Dict[str, Any]
+    members: List[MemberModel]
+    transactions: List[TransactionModel]
 
 
-class SummaryStats(BaseModel):
+class SummaryStats(TypedDict):
     min_total_amount: Optional[float]
     max_total_amount: Optional[float]
     min_risk: Optional[int]
@@ -70,39 +78,39 @@ class SummaryStats(BaseModel):
     max_tx_amount: Optional[float]
 
 
-class DatasetSummaryResponse(BaseModel):
+class DatasetSummaryResponse(TypedDict):
     runs: List[RunOptionModel]
     aggregated: SummaryStats
     total_groups: int
     total_records: Optional[int]
-    summary_metadata: Dict[str, Any] = Field(default_factory=dict)
+    summary_metadata: Dict[str, Any]
 
 
-class GroupListResponse(BaseModel):
+class GroupListResponse(TypedDict):
     items: List[GroupSummary]
     total: int
     aggregated: SummaryStats
     reported_ids: List[str]
 
 
-class GroupDetailResponse(BaseModel):
+class GroupDetailResponse(TypedDict):
     group: GroupDetail
-    snapshots: List[Dict[str, Any]] = Field(default_factory=list)
-    snapshot_count: int = 0
+    snapshots: List[Dict[str, Any]]
+    snapshot_count: int
 
 
-class SnapshotListResponse(BaseModel):
-    items: List[Dict[str, Any]] = Field(default_factory=list)
+class SnapshotListResponse(TypedDict):
+    items: List[Dict[str, Any]]
     total: int
     limit: int
 
 
-class ReportRecord(BaseModel):
+class ReportRecord(TypedDict):
     timestamp: str
     group_id: Optional[str]
     reason: str
-    checks: List[str] = Field(default_factory=list)
-    snapshot: Dict[str, Any] = Field(default_factory=dict)
+    checks: List[str]
+    snapshot: Dict[str, Any]
 
 
 class ReportCreateRequest(BaseModel):
@@ -111,35 +119,35 @@ class ReportCreateRequest(BaseModel):
     checks: Sequence[str] = Field(default_factory=list)
 
 
-class ReportCreateResponse(BaseModel):
+class ReportCreateResponse(TypedDict):
     record: ReportRecord
     total_reports: int
 
 
-class NetworkNode(BaseModel):
+class NetworkNode(TypedDict):
     id: str
     label: str
     kind: str
     risk_score: Optional[int]
     member_count: Optional[int]
     total_amount: Optional[float]
-    highlight: bool = False
+    highlight: bool
 
 
-class NetworkEdge(BaseModel):
+class NetworkEdge(TypedDict):
     source: str
     target: str
     amount: float
     count: int
-    directions: List[str] = Field(default_factory=list)
+    directions: List[str]
 
 
-class NetworkResponse(BaseModel):
+class NetworkResponse(TypedDict):
     nodes: List[NetworkNode]
     edges: List[NetworkEdge]
 
 
-class SettingsResponse(BaseModel):
+class SettingsResponse(TypedDict):
     title: str
     report_checks: List[str]
     default_highlight_reported: bool
@@ -0,0 +1,82 @@
+"""Response classes tuned for the AML UI backend."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def orjson_default(value: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serialisable")
+
+
+def render_json(content: Any) -> bytes:
+    """Encode ``content`` with the options shared by every JSON response."""
+
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered in a single orjson pass."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A JSON body encoded once, paired with a strong ETag for revalidation."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "EncodedPayload":
+        return cls(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+    @classmethod
+    def encode(cls, content: Any) -> "EncodedPayload":
+        return cls.from_body(render_json(content))
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def conditional_response(
+    request: Request, payload: EncodedPayload, media_type: str = "application/json"
+) -> Response:
+    """Serve ``payload``, or an empty 304 when the client already holds it."""
+
+    headers = {"ETag": payload.etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(payload.body, media_type=media_type, headers=headers)
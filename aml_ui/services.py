@@ -2,33 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
-from copy import deepcopy
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import re
+import threading
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional; scoring stays plain Python
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorate
 
 from .config import AppConfig, get_config
 from .data_access import (
+    append_report,
     ensure_reports_file,
+    group_files_signature,
     load_group_payloads,
+    load_or_build_cache,
     load_reports,
+    load_snapshot_page,
     load_snapshots,
     load_summary,
     parse_iso_datetime,
-    write_reports,
 )
 from .models import (
     DatasetSummaryResponse,
     GroupDetail,
     GroupDetailResponse,
-    GroupListResponse,
     GroupMetrics,
     GroupSummary,
     MemberModel,
     NetworkEdge,
     NetworkNode,
-    NetworkResponse,
     ReportCreateRequest,
     ReportCreateResponse,
     ReportRecord,
@@ -38,6 +55,7 @@ from .models import (
     SummaryStats,
     TransactionModel,
 )
+from .responses import EncodedPayload, render_json
 
 
 @dataclass(frozen=True)
@@ -58,6 +76,260 @@ class TransactionFilters:
     end_date: Optional[datetime] = None
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Sentinels for groups without timestamps so date bounds never match them.
+_NS_MIN = np.iinfo(np.int64).min
+_NS_MAX = np.iinfo(np.int64).max
+# Dates outside datetime64[ns] (years 1677-2262) are clamped to these, inside the
+# sentinels; their exact values are kept as ``datetime``s beside the ns columns.
+_NS_CLAMP_MIN = _NS_MIN + 1
+_NS_CLAMP_MAX = _NS_MAX - 1
+
+
+def _to_epoch_ns(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    ns = (value - _EPOCH) // timedelta(microseconds=1) * 1000
+    return min(max(ns, _NS_CLAMP_MIN), _NS_CLAMP_MAX)
+
+
+def _from_epoch_ns(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value // 1000)
+
+
+@dataclass(frozen=True)
+class GroupColumns:
+    """Struct-of-arrays view of the group metrics used for filtering and summaries.
+
+    Row ``i`` describes ``groups[i]`` of the list the columns were built from.
+    """
+
+    group_ids: np.ndarray
+    risk_score: np.ndarray
+    total_amount: np.ndarray
+    first_seen_ns: np.ndarray
+    last_seen_ns: np.ndarray
+    first_seen: np.ndarray  # object, the exact datetimes behind clamped ns values
+    last_seen: np.ndarray
+    min_tx_amount: np.ndarray  # NaN for groups without numeric amounts
+    max_tx_amount: np.ndarray
+    # Column bounds let filter_groups drop comparisons that cannot exclude a row.
+    min_risk: int = 0
+    min_total: float = float("inf")
+    max_total: float = float("-inf")
+
+    @classmethod
+    def from_groups(cls, groups: Sequence[Dict[str, Any]]) -> "GroupColumns":
+        count = len(groups)
+        metrics = [group["_metrics"] for group in groups]
+        columns = cls(
+            group_ids=np.array([group.get("group_id") or "" for group in groups], dtype=object),
+            risk_score=np.fromiter((m["risk_score"] for m in metrics), dtype=np.int32, count=count),
+            total_amount=np.fromiter((m["total_amount"] for m in metrics), dtype=np.float64, count=count),
+            first_seen_ns=np.fromiter((group["_seen_ns"][0] for group in groups), dtype=np.int64, count=count),
+            last_seen_ns=np.fromiter((group["_seen_ns"][1] for group in groups), dtype=np.int64, count=count),
+            first_seen=np.array([m["first_seen"] for m in metrics], dtype=object),
+            last_seen=np.array([m["last_seen"] for m in metrics], dtype=object),
+            min_tx_amount=np.fromiter(
+                (math.nan if m["min_transaction_amount"] is None else m["min_transaction_amount"] for m in metrics),
+                dtype=np.float64,
+                count=count,
+            ),
+            max_tx_amount=np.fromiter(
+                (math.nan if m["max_transaction_amount"] is None else m["max_transaction_amount"] for m in metrics),
+                dtype=np.float64,
+                count=count,
+            ),
+        )
+        if not count:
+            return columns
+        return replace(
+            columns,
+            min_risk=int(columns.risk_score.min()),
+            min_total=float(columns.total_amount.min()),
+            max_total=float(columns.total_amount.max()),
+        )
+
+
+IN_DIRECTIONS = frozenset({"in", "incoming", "credit"})
+OUT_DIRECTIONS = frozenset({"out", "outgoing", "debit"})
+_IN_DIRECTIONS_ARRAY = np.array(sorted(IN_DIRECTIONS))
+_OUT_DIRECTIONS_ARRAY = np.array(sorted(OUT_DIRECTIONS))
+
+
+class Direction(IntEnum):
+    """Transaction direction, classified once at enrichment."""
+
+    UNKNOWN = 0
+    IN = 1
+    OUT = 2
+
+
+@dataclass(frozen=True)
+class TransactionArrays:
+    """Column view of a group's transactions; row ``i`` is ``transactions[i]``."""
+
+    amount: np.ndarray  # float64, NaN where the amount is not numeric
+    direction: np.ndarray  # lower-cased, "" where missing
+    direction_code: np.ndarray  # int8 Direction
+    counterparty: np.ndarray  # object, None where missing
+    timestamp: np.ndarray  # datetime64[ns] in UTC, NaT where unparseable
+
+
+ParsedTimestamps = Tuple[np.ndarray, List[Optional[datetime]]]
+
+# A time of day followed by "Z" or a numeric UTC offset.
+_UTC_OFFSET = re.compile(r"\d[T ]\d{2}.*(?:[zZ]|[+-]\d{2}(?::?\d{2})?)$")
+
+
+def _parse_batch(raw_timestamps: Sequence[Optional[str]]) -> ParsedTimestamps:
+    parsed = pd.to_datetime(raw_timestamps, errors="coerce", utc=True, format="ISO8601")
+    column = parsed.tz_localize(None).to_numpy(dtype="datetime64[ns]", copy=True)
+    return column, [None if ts is pd.NaT else ts for ts in parsed.to_pydatetime()]
+
+
+def _parse_timestamps(raw_timestamps: Sequence[Optional[str]]) -> ParsedTimestamps:
+    """Parse ISO-8601 strings in batches into a UTC ``datetime64[ns]`` column and ``datetime``s.
+
+    Naive values are read as UTC. pandas would read a naive time at the offset
+    of an earlier value in the same batch, so values with and without an
+    offset are parsed in separate batches.
+
+    pandas coerces dates outside the ``datetime64[ns]`` range to NaT; those are
+    parsed again one by one, keep their exact ``datetime`` and get a clamped
+    value in the column.
+    """
+
+    count = len(raw_timestamps)
+    has_offset = np.fromiter(
+        (value.__class__ is str and _UTC_OFFSET.search(value) is not None for value in raw_timestamps),
+        dtype=bool,
+        count=count,
+    )
+    if has_offset.all() or not has_offset.any():
+        column, datetimes = _parse_batch(raw_timestamps)
+    else:
+        values = np.asarray(raw_timestamps, dtype=object)
+        column = np.empty(count, dtype="datetime64[ns]")
+        datetimes = [None] * count
+        for selector in (has_offset, ~has_offset):
+            positions = np.flatnonzero(selector)
+            column[positions], parsed = _parse_batch(values[positions])
+            for position, value in zip(positions.tolist(), parsed):
+                datetimes[position] = value
+    column_ns = column.view(np.int64)
+    for position in np.flatnonzero(np.isnat(column)).tolist():
+        value = parse_iso_datetime(raw_timestamps[position])
+        if value is not None:
+            datetimes[position] = value
+            column_ns[position] = _to_epoch_ns(value)
+    return column, datetimes
+
+
+def _aggregate_transactions(
+    transactions: Sequence[Dict[str, Any]],
+    timestamps: Optional[ParsedTimestamps] = None,
+) -> Tuple[TransactionArrays, List[Optional[datetime]]]:
+    """Extract the transaction columns in one pass.
+
+    ``timestamps`` carries the already parsed timestamps of ``transactions``;
+    they are parsed here when omitted. The ``datetime``s are also returned for
+    the detail view.
+    """
+
+    amounts: List[float] = []
+    directions: List[str] = []
+    counterparties: List[Any] = []
+    raw_timestamps: List[Optional[str]] = []
+    for tx in transactions:
+        amount = tx.get("amount")
+        amounts.append(float(amount) if isinstance(amount, (int, float)) else math.nan)
+        directions.append(tx.get("direction") or "")
+        counterparties.append(tx.get("counterparty_id"))
+        raw_timestamps.append(tx.get("timestamp") or None)
+    timestamp_column, parsed = timestamps if timestamps is not None else _parse_timestamps(raw_timestamps)
+    direction = np.char.lower(np.asarray(directions, dtype=str))
+    direction_code = np.full(direction.shape, Direction.UNKNOWN, dtype=np.int8)
+    direction_code[np.isin(direction, _IN_DIRECTIONS_ARRAY)] = Direction.IN
+    direction_code[np.isin(direction, _OUT_DIRECTIONS_ARRAY)] = Direction.OUT
+    arrays = TransactionArrays(
+        amount=np.asarray(amounts, dtype=np.float64),
+        direction=direction,
+        direction_code=direction_code,
+        counterparty=np.asarray(counterparties, dtype=object),
+        timestamp=timestamp_column,
+    )
+    return arrays, parsed
+
+
+# Bump when enrich_group's output changes so on-disk caches are rebuilt.
+ENRICHMENT_VERSION = 7
+
+# Page size of /api/snapshots when the client does not pass ``limit``.
+DEFAULT_SNAPSHOT_LIMIT = 100
+
+# Streamed responses are flushed in chunks of roughly this size.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Closing bytes of an encoded ``GroupSummary``, whose last key is ``reported``.
+_REPORTED_TRUE = b"true}"
+_REPORTED_FALSE = b"false}"
+
+EdgeTotals = Tuple[float, int, FrozenSet[str], Optional[bytes]]
+
+
+@dataclass(frozen=True)
+class NetworkFragment:
+    """Pre-serialised contribution of a single group to the network view.
+
+    ``edges`` maps ``(source, target)`` to the raw amount, count, directions
+    and the encoded edge, so fragments can be merged without re-encoding
+    unless two groups share an edge.
+    """
+
+    group_id: str
+    node: bytes
+    highlighted_node: bytes
+    counterparties: Tuple[Tuple[str, bytes], ...]
+    edges: Dict[Tuple[str, str], EdgeTotals]
+
+
+def _encode_array(items: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(items) + b"]"
+
+
+def _stream_array(buffer: bytearray, items: Iterable[bytes]) -> Iterator[bytes]:
+    """Append a JSON array of encoded items to ``buffer``, yielding it whenever it fills."""
+
+    buffer += b"["
+    for index, item in enumerate(items):
+        if index:
+            buffer += b","
+        buffer += item
+        if len(buffer) >= STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+
+
+def _encode_object(fields: Sequence[Tuple[str, bytes]]) -> bytes:
+    """Assemble a JSON object from already-encoded member values."""
+
+    return b"{" + b",".join(render_json(key) + b":" + value for key, value in fields) + b"}"
+
+
+def _encode_edge(source: str, target: str, amount: float, count: int, directions: Iterable[str]) -> bytes:
+    edge = NetworkEdge(
+        source=source,
+        target=target,
+        amount=round(amount, 2),
+        count=count,
+        directions=sorted(directions),
+    )
+    return render_json(edge)
+
+
+@njit(cache=True)
 def compute_risk_score(
     member_count: int,
     transaction_count: int,
@@ -73,37 +345,37 @@ def compute_risk_score(
     return int(max(1.0, min(99.0, round(raw_score))))
 
 
-def enrich_group(raw_group: Dict[str, Any]) -> Dict[str, Any]:
-    group = deepcopy(raw_group)
+# Compile on import rather than on the first request (a no-op without numba).
+compute_risk_score(1, 1, 1.0, 1, 0.5)
+
+
+def enrich_group(raw_group: Dict[str, Any], timestamps: Optional[ParsedTimestamps] = None) -> Dict[str, Any]:
+    # Only top-level keys are added; members and transactions are shared with
+    # the raw payload and never mutated.
+    group = dict(raw_group)
     members = group.get("members") or []
     transactions = group.get("transactions") or []
-    parsed_transactions: List[Dict[str, Any]] = []
-    total_amount = 0.0
-    unique_counterparties = set()
-    outgoing_count = 0
-    timestamps: List[datetime] = []
-    min_amount: Optional[float] = None
-    max_amount: Optional[float] = None
+    arrays, timestamps = _aggregate_transactions(transactions, timestamps)
 
-    for tx in transactions:
-        tx_amount = tx.get("amount")
-        if isinstance(tx_amount, (int, float)):
-            amount_value = float(tx_amount)
-            total_amount += amount_value
-            min_amount = amount_value if min_amount is None else min(min_amount, amount_value)
-            max_amount = amount_value if max_amount is None else max(max_amount, amount_value)
-        counterparty = tx.get("counterparty_id")
-        if counterparty:
-            unique_counterparties.add(counterparty)
-        normalized_direction = (tx.get("direction") or "").lower()
-        if normalized_direction in {"out", "outgoing", "debit"}:
-            outgoing_count += 1
-        ts = parse_iso_datetime(tx.get("timestamp"))
-        if ts:
-            timestamps.append(ts)
-        parsed = dict(tx)
-        parsed["parsed_timestamp"] = ts
-        parsed_transactions.append(parsed)
+    amounts = arrays.amount[~np.isnan(arrays.amount)]
+    # fsum is exactly rounded, so the total does not depend on summation order.
+    total_amount = math.fsum(amounts.tolist())
+    min_amount = float(amounts.min()) if amounts.size else None
+    max_amount = float(amounts.max()) if amounts.size else None
+    present = arrays.counterparty[arrays.counterparty.astype(bool)]
+    # A set, not np.unique, which has to sort and fails on mixed str/int ids.
+    unique_counterparties = len(set(present.tolist()))
+    outgoing_count = int(np.count_nonzero(arrays.direction_code == Direction.OUT))
+    seen = arrays.timestamp[~np.isnat(arrays.timestamp)].view(np.int64)
+    first_seen_ns = int(seen.min()) if seen.size else _NS_MAX
+    last_seen_ns = int(seen.max()) if seen.size else _NS_MIN
+    first_seen = last_seen = None
+    if seen.size:
+        first_seen = _from_epoch_ns(first_seen_ns)
+        last_seen = _from_epoch_ns(last_seen_ns)
+        if first_seen_ns == _NS_CLAMP_MIN or last_seen_ns == _NS_CLAMP_MAX:
+            dated = [ts for ts in timestamps if ts is not None]
+            first_seen, last_seen = min(dated), max(dated)
 
     transaction_count = len(transactions)
     outgoing_ratio = outgoing_count / transaction_count if transaction_count else 0.0
@@ -111,32 +383,55 @@ def enrich_group(raw_group: Dict[str, Any]) -> Dict[str, Any]:
         member_count=len(members),
         transaction_count=transaction_count,
         total_amount=total_amount,
-        unique_counterparties=len(unique_counterparties),
+        unique_counterparties=unique_counterparties,
         outgoing_ratio=outgoing_ratio,
     )
-    first_seen = min(timestamps) if timestamps else None
-    last_seen = max(timestamps) if timestamps else None
-
-    group["_metrics"] = {
-        "member_count": len(members),
-        "transaction_count": transaction_count,
-        "total_amount": round(total_amount, 2),
-        "unique_counterparties": len(unique_counterparties),
-        "outgoing_ratio": outgoing_ratio,
-        "first_seen": first_seen,
-        "last_seen": last_seen,
-        "min_transaction_amount": min_amount,
-        "max_transaction_amount": max_amount,
-        "risk_score": risk_score,
-    }
-    group["_transactions"] = parsed_transactions
+
+    # Responses embed this dict as-is rather than copying it per request.
+    group["_metrics"] = GroupMetrics(
+        member_count=len(members),
+        transaction_count=transaction_count,
+        total_amount=round(total_amount, 2),
+        unique_counterparties=unique_counterparties,
+        outgoing_ratio=outgoing_ratio,
+        first_seen=first_seen,
+        last_seen=last_seen,
+        min_transaction_amount=min_amount,
+        max_transaction_amount=max_amount,
+        risk_score=risk_score,
+    )
+    # Kept beside the metrics (which are rendered as-is) for GroupColumns.
+    group["_seen_ns"] = (first_seen_ns, last_seen_ns)
+    # Detail payloads are built from the raw rows and these timestamps on demand.
+    group["_tx_timestamps"] = timestamps
+    group["_tx_arrays"] = arrays
     canonical = group.get("canonical_attributes") or {}
     group["_display_name"] = canonical.get("name") or group.get("group_id")
     return group
 
 
-def summarize_groups(groups: Sequence[Dict[str, Any]]) -> SummaryStats:
-    if not groups:
+def enrich_groups(raw_groups: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Enrich ``raw_groups``, parsing every transaction timestamp in a single batch."""
+
+    transaction_lists = [group.get("transactions") or [] for group in raw_groups]
+    column, parsed = _parse_timestamps(
+        [tx.get("timestamp") or None for transactions in transaction_lists for tx in transactions]
+    )
+    enriched: List[Dict[str, Any]] = []
+    offset = 0
+    for group, transactions in zip(raw_groups, transaction_lists):
+        end = offset + len(transactions)
+        enriched.append(enrich_group(group, (column[offset:end], parsed[offset:end])))
+        offset = end
+    return enriched
+
+
+def summarize_groups(columns: GroupColumns, indices: Optional[np.ndarray] = None) -> SummaryStats:
+    """Aggregate the rows at ``indices`` (every row when omitted)."""
+
+    rows = slice(None) if indices is None else indices
+    totals = columns.total_amount[rows]
+    if not totals.size:
         return SummaryStats(
             min_total_amount=None,
             max_total_amount=None,
@@ -147,138 +442,287 @@ def summarize_groups(groups: Sequence[Dict[str, Any]]) -> SummaryStats:
             min_tx_amount=None,
             max_tx_amount=None,
         )
-    totals = [g["_metrics"]["total_amount"] for g in groups]
-    risks = [g["_metrics"]["risk_score"] for g in groups]
-    tx_min_values: List[float] = []
-    tx_max_values: List[float] = []
-    dates = []
-    for g in groups:
-        metrics = g["_metrics"]
-        tx_min = metrics.get("min_transaction_amount")
-        tx_max = metrics.get("max_transaction_amount")
-        if tx_min is not None:
-            tx_min_values.append(float(tx_min))
-        if tx_max is not None:
-            tx_max_values.append(float(tx_max))
-        if metrics.get("first_seen"):
-            dates.append(metrics["first_seen"])
-        if metrics.get("last_seen"):
-            dates.append(metrics["last_seen"])
+    risks = columns.risk_score[rows]
+    tx_min = columns.min_tx_amount[rows]
+    tx_min = tx_min[~np.isnan(tx_min)]
+    tx_max = columns.max_tx_amount[rows]
+    tx_max = tx_max[~np.isnan(tx_max)]
+    # first_seen <= last_seen per group, so the date range spans min(first) to max(last).
+    # Undated groups hold the opposite sentinel and only win when no group is dated.
+    first_seen = columns.first_seen_ns[rows]
+    last_seen = columns.last_seen_ns[rows]
+    min_ns = int(first_seen.min())
+    max_ns = int(last_seen.max())
+    min_date = None if min_ns == _NS_MAX else _from_epoch_ns(min_ns)
+    max_date = None if max_ns == _NS_MIN else _from_epoch_ns(max_ns)
+    if min_ns == _NS_CLAMP_MIN:
+        min_date = min(columns.first_seen[rows][first_seen == min_ns])
+    if max_ns == _NS_CLAMP_MAX:
+        max_date = max(columns.last_seen[rows][last_seen == max_ns])
     return SummaryStats(
-        min_total_amount=min(totals),
-        max_total_amount=max(totals),
-        min_risk=min(risks),
-        max_risk=max(risks),
-        min_date=min(dates) if dates else None,
-        max_date=max(dates) if dates else None,
-        min_tx_amount=min(tx_min_values) if tx_min_values else None,
-        max_tx_amount=max(tx_max_values) if tx_max_values else None,
+        min_total_amount=float(totals.min()),
+        max_total_amount=float(totals.max()),
+        min_risk=int(risks.min()),
+        max_risk=int(risks.max()),
+        min_date=min_date,
+        max_date=max_date,
+        min_tx_amount=float(tx_min.min()) if tx_min.size else None,
+        max_tx_amount=float(tx_max.max()) if tx_max.size else None,
     )
 
 
 def filter_groups(
-    groups: Sequence[Dict[str, Any]],
+    columns: GroupColumns,
     *,
     filters: GroupFilters,
-    reported_ids: Iterable[str],
-) -> List[Dict[str, Any]]:
-    reported_set = set(reported_ids)
-    filtered: List[Dict[str, Any]] = []
-    for group in groups:
-        metrics = group["_metrics"]
-        if metrics["risk_score"] < filters.min_risk:
-            continue
-        total_amount = metrics["total_amount"]
-        if total_amount < filters.min_total or total_amount > filters.max_total:
-            continue
-        if filters.reported_only and group.get("group_id") not in reported_set:
+    reported: np.ndarray,
+) -> np.ndarray:
+    """Return the indices of the groups matching ``filters``.
+
+    ``reported`` is a boolean mask over the rows of ``columns``.
+
+    Only bounds that can exclude at least one row contribute a mask, so the
+    default (unfiltered) request does no per-row work at all.
+    """
+
+    masks: List[np.ndarray] = []
+    if filters.min_risk > columns.min_risk:
+        masks.append(columns.risk_score >= filters.min_risk)
+    if filters.min_total > columns.min_total:
+        masks.append(columns.total_amount >= filters.min_total)
+    if filters.max_total < columns.max_total:
+        masks.append(columns.total_amount <= filters.max_total)
+    if filters.reported_only:
+        masks.append(reported)
+    if filters.start_date:
+        masks.append(columns.last_seen_ns >= _to_epoch_ns(filters.start_date))
+    if filters.end_date:
+        masks.append(columns.first_seen_ns <= _to_epoch_ns(filters.end_date))
+    if not masks:
+        return np.arange(len(columns.group_ids))
+    # The reported mask is cached by the service, so combine into a fresh array.
+    mask = masks[0] if len(masks) == 1 else masks[0] & masks[1]
+    for extra in masks[2:]:
+        mask &= extra
+    return np.flatnonzero(mask)
+
+
+def filter_transactions(arrays: TransactionArrays, filters: TransactionFilters) -> np.ndarray:
+    """Return the indices of the transactions matching ``filters``.
+
+    Non-numeric amounts count as 0.0. Timestamps are compared as int64 ns,
+    where NaT is the int64 minimum, so any date bound also drops undated rows.
+    """
+
+    amounts = np.nan_to_num(arrays.amount, nan=0.0)
+    timestamps = arrays.timestamp.view(np.int64)
+    start_ns, end_ns = _NS_MIN, _NS_MAX
+    if filters.start_date or filters.end_date:
+        start_ns = _to_epoch_ns(filters.start_date) if filters.start_date else _NS_MIN + 1
+        if filters.end_date:
+            end_ns = _to_epoch_ns(filters.end_date)
+    mask = (
+        (amounts >= filters.min_amount)
+        & (amounts <= filters.max_amount)
+        & (timestamps >= start_ns)
+        & (timestamps <= end_ns)
+    )
+    return np.flatnonzero(mask)
+
+
+def build_network_fragment(group: Dict[str, Any]) -> Optional[NetworkFragment]:
+    group_id = group.get("group_id")
+    if not group_id:
+        return None
+    metrics = group["_metrics"]
+    node = NetworkNode(
+        id=group_id,
+        label=group.get("_display_name") or group_id,
+        kind="group",
+        risk_score=metrics.get("risk_score"),
+        member_count=metrics.get("member_count"),
+        total_amount=metrics.get("total_amount"),
+        highlight=False,
+    )
+    counterparties: Dict[str, bytes] = {}
+    edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    arrays: TransactionArrays = group["_tx_arrays"]
+    for tx, direction, direction_code in zip(
+        group.get("transactions") or [], arrays.direction.tolist(), arrays.direction_code.tolist()
+    ):
+        counterparty = tx.get("counterparty_id")
+        if not counterparty:
             continue
-        if filters.start_date or filters.end_date:
-            group_start = metrics.get("first_seen")
-            group_end = metrics.get("last_seen")
-            if filters.start_date and (not group_end or group_end < filters.start_date):
-                continue
-            if filters.end_date and (not group_start or group_start > filters.end_date):
-                continue
-        filtered.append(group)
-    return filtered
+        if counterparty != group_id and counterparty not in counterparties:
+            counterparty_node = NetworkNode(
+                id=counterparty,
+                label=counterparty[:24],
+                kind="counterparty",
+                risk_score=None,
+                member_count=None,
+                total_amount=None,
+                highlight=False,
+            )
+            counterparties[counterparty] = render_json(counterparty_node)
+        amount = float(tx.get("amount") or 0.0)
+        if direction_code == Direction.IN:
+            src, dst = counterparty, group_id
+        else:
+            src, dst = group_id, counterparty
+        entry = edges.setdefault(
+            (src, dst),
+            {
+                "amount": 0.0,
+                "count": 0,
+                "directions": set(),
+            },
+        )
+        entry["amount"] += amount
+        entry["count"] += 1
+        if direction:
+            entry["directions"].add(direction)
+
+    return NetworkFragment(
+        group_id=group_id,
+        node=render_json(node),
+        highlighted_node=render_json({**node, "highlight": True}),
+        counterparties=tuple(counterparties.items()),
+        edges={
+            (src, dst): (
+                data["amount"],
+                data["count"],
+                frozenset(data["directions"]),
+                _encode_edge(src, dst, data["amount"], data["count"], data["directions"]),
+            )
+            for (src, dst), data in edges.items()
+        },
+    )
 
 
 def build_network_payload(
-    groups: Sequence[Dict[str, Any]],
+    fragments: Sequence[NetworkFragment],
     *,
-    reported_ids: Iterable[str],
+    reported_ids: FrozenSet[str],
     highlight_reported: bool,
-) -> NetworkResponse:
-    reported_set = set(reported_ids)
-    nodes: Dict[str, NetworkNode] = {}
-    edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+) -> Iterator[bytes]:
+    """Merge per-group fragments and stream the encoded ``NetworkResponse``.
 
-    for group in groups:
-        group_id = group.get("group_id")
-        if not group_id:
-            continue
-        metrics = group["_metrics"]
-        nodes[group_id] = NetworkNode(
-            id=group_id,
-            label=group.get("_display_name") or group_id,
-            kind="group",
-            risk_score=metrics.get("risk_score"),
-            member_count=metrics.get("member_count"),
-            total_amount=metrics.get("total_amount"),
-            highlight=highlight_reported and group_id in reported_set,
-        )
-        for tx in group.get("_transactions") or []:
-            counterparty = tx.get("counterparty_id")
-            if not counterparty:
-                continue
-            if counterparty not in nodes:
-                nodes[counterparty] = NetworkNode(
-                    id=counterparty,
-                    label=counterparty[:24],
-                    kind="counterparty",
-                    risk_score=None,
-                    member_count=None,
-                    total_amount=None,
-                    highlight=False,
-                )
-            amount = float(tx.get("amount") or 0.0)
-            direction = (tx.get("direction") or "").lower()
-            if direction in {"in", "incoming", "credit"}:
-                src, dst = counterparty, group_id
+    Node and edge blobs are already encoded, so chunks go out as soon as they
+    fill instead of joining the whole document in memory first.
+    """
+
+    nodes: Dict[str, bytes] = {}
+    edges: Dict[Tuple[str, str], EdgeTotals] = {}
+
+    for fragment in fragments:
+        if highlight_reported and fragment.group_id in reported_ids:
+            nodes[fragment.group_id] = fragment.highlighted_node
+        else:
+            nodes[fragment.group_id] = fragment.node
+        for counterparty, node in fragment.counterparties:
+            nodes.setdefault(counterparty, node)
+        for key, totals in fragment.edges.items():
+            existing = edges.get(key)
+            if existing is None:
+                edges[key] = totals
             else:
-                src, dst = group_id, counterparty
-            key = (src, dst)
-            entry = edges.setdefault(
-                key,
-                {
-                    "amount": 0.0,
-                    "count": 0,
-                    "directions": set(),
-                },
-            )
-            entry["amount"] += amount
-            entry["count"] += 1
-            if direction:
-                entry["directions"].add(direction)
-
-    edge_models = [
-        NetworkEdge(
-            source=src,
-            target=dst,
-            amount=round(data["amount"], 2),
-            count=data["count"],
-            directions=sorted(data["directions"]),
-        )
-        for (src, dst), data in edges.items()
-    ]
-    return NetworkResponse(nodes=list(nodes.values()), edges=edge_models)
+                # Shared edge across groups: merge totals and re-encode later.
+                edges[key] = (
+                    existing[0] + totals[0],
+                    existing[1] + totals[1],
+                    existing[2] | totals[2],
+                    None,
+                )
+
+    encoded_edges = (
+        encoded if encoded is not None else _encode_edge(src, dst, amount, count, directions)
+        for (src, dst), (amount, count, directions, encoded) in edges.items()
+    )
+    buffer = bytearray(b'{"nodes":')
+    yield from _stream_array(buffer, nodes.values())
+    buffer += b',"edges":'
+    yield from _stream_array(buffer, encoded_edges)
+    buffer += b"}"
+    yield bytes(buffer)
+
+
+@dataclass(frozen=True)
+class SnapshotIndex:
+    """Snapshot positions keyed by the fields a group detail matches on."""
+
+    by_record_id: Dict[Any, List[int]]
+    by_signature: Dict[Any, List[int]]
+    by_tax_id: Dict[Any, List[int]]
+
+    @classmethod
+    def build(cls, snapshots: Sequence[Any]) -> "SnapshotIndex":
+        by_record_id: Dict[Any, List[int]] = {}
+        by_signature: Dict[Any, List[int]] = {}
+        by_tax_id: Dict[Any, List[int]] = {}
+        for position, snapshot in enumerate(snapshots):
+            if not isinstance(snapshot, dict):
+                continue
+            record_id = snapshot.get("record_id")
+            if record_id is not None:
+                by_record_id.setdefault(record_id, []).append(position)
+            signature = snapshot.get("signature")
+            if signature is not None:
+                by_signature.setdefault(signature, []).append(position)
+            tax_id = (snapshot.get("normalized_attributes") or {}).get("tax_id")
+            if tax_id:
+                by_tax_id.setdefault(tax_id, []).append(position)
+        return cls(by_record_id=by_record_id, by_signature=by_signature, by_tax_id=by_tax_id)
+
+    def positions(self, record_ids: Iterable[Any], signatures: Iterable[Any], tax_id: Any) -> List[int]:
+        """Return the sorted positions of snapshots matching any of the keys."""
 
+        matched = set()
+        for record_id in record_ids:
+            matched.update(self.by_record_id.get(record_id, ()))
+        for signature in signatures:
+            matched.update(self.by_signature.get(signature, ()))
+        if tax_id:
+            matched.update(self.by_tax_id.get(tax_id, ()))
+        return sorted(matched)
 
-def _convert_transactions(raw_transactions: Sequence[Dict[str, Any]]) -> List[TransactionModel]:
+
+@dataclass(frozen=True)
+class LoadedGroups:
+    """One load of the group artifacts: the groups, their id index and their columns.
+
+    Built in full before it is published, so a request that reads it once sees
+    positions, ids and columns from the same load even while a refresh runs.
+    """
+
+    groups: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    columns: GroupColumns
+    # Encoded per-group payloads, filled on first use and dropped with the load.
+    # Keyed by row in ``groups``: ids are not unique across entity files.
+    summary_prefixes: Dict[int, bytes] = field(default_factory=dict)
+    network_fragments: Dict[int, Optional[NetworkFragment]] = field(default_factory=dict)
+    # Keyed by id: the detail view only ever resolves an id to ``by_id[id]``.
+    member_payloads: Dict[str, List[MemberModel]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, groups: List[Dict[str, Any]]) -> "LoadedGroups":
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for group in groups:
+            if group.get("group_id"):
+                by_id.setdefault(group["group_id"], group)
+        return cls(groups=groups, by_id=by_id, columns=GroupColumns.from_groups(groups))
+
+
+def _convert_transactions(
+    raw_transactions: Sequence[Dict[str, Any]],
+    timestamps: Optional[Sequence[Optional[datetime]]] = None,
+) -> List[TransactionModel]:
+    """Build transaction payloads, parsing timestamps unless already parsed."""
+
+    if timestamps is None:
+        timestamps = [parse_iso_datetime(tx.get("timestamp")) for tx in raw_transactions]
     converted: List[TransactionModel] = []
-    for tx in raw_transactions:
-        timestamp = tx.get("parsed_timestamp") or parse_iso_datetime(tx.get("timestamp"))
+    for tx, timestamp in zip(raw_transactions, timestamps):
         converted.append(
             TransactionModel(
                 transaction_id=tx.get("transaction_id"),
@@ -309,25 +753,92 @@ def _convert_members(raw_members: Sequence[Dict[str, Any]]) -> List[MemberModel]
     return members
 
 
+def _report_record(entry: Dict[str, Any]) -> ReportRecord:
+    return ReportRecord(
+        timestamp=entry["timestamp"],
+        group_id=entry.get("group_id"),
+        reason=entry["reason"],
+        checks=list(entry.get("checks") or []),
+        snapshot=dict(entry.get("snapshot") or {}),
+    )
+
+
 class GroupService:
     """Facade coordinating artifact access and domain logic."""
 
     def __init__(self, config: Optional[AppConfig] = None) -> None:
         self._config = config or get_config()
-        self._groups_cache: Optional[List[Dict[str, Any]]] = None
+        self._loaded: Optional[LoadedGroups] = None
+        # Reported group ids (in report order) and their set, derived from the reports cache.
+        self._reported_cache: Optional[Tuple[List[str], FrozenSet[str]]] = None
+        # The reported mask with the load and reported ids it was built from.
+        self._reported_mask_cache: Optional[
+            Tuple[LoadedGroups, Tuple[List[str], FrozenSet[str]], np.ndarray]
+        ] = None
         self._summary_cache: Optional[Dict[str, Any]] = None
         self._snapshots_cache: Optional[List[Dict[str, Any]]] = None
+        self._snapshot_index_cache: Optional[SnapshotIndex] = None
         self._reports_cache: Optional[List[Dict[str, Any]]] = None
+        self._report_records_cache: Optional[List[ReportRecord]] = None
+        # Encoded + ETagged responses for endpoints that only change on refresh.
+        self._encoded_payloads: Dict[str, EncodedPayload] = {}
+        # Bumped by refresh(); a payload built across a refresh is not cached.
+        self._generation = 0
+        # Guards the two above; separate from the load lock so cached endpoints
+        # such as /api/settings never wait behind a reload.
+        self._encoded_lock = threading.Lock()
+        # Concurrent cold loads and refreshes share a single reload.
+        self._load_lock = threading.Lock()
+        # Reentrant: the reported-id caches are built under it from helpers that also take it.
+        self._reports_lock = threading.RLock()
+        self._refresh_task: Optional[asyncio.Future[None]] = None
 
     @property
     def config(self) -> AppConfig:
         return self._config
 
-    def _load_groups(self) -> List[Dict[str, Any]]:
-        if self._groups_cache is None:
-            raw_groups = load_group_payloads(self._config.paths.entities_dir)
-            self._groups_cache = [enrich_group(group) for group in raw_groups]
-        return self._groups_cache
+    def _load_groups(self) -> LoadedGroups:
+        """Return the current load; callers read it once per request."""
+
+        loaded = self._loaded
+        if loaded is None:
+            with self._load_lock:
+                loaded = self._loaded
+                if loaded is None:
+                    loaded = self._loaded = LoadedGroups.build(self._enrich_groups())
+        return loaded
+
+    def _find_group(self, group_id: str) -> Optional[Dict[str, Any]]:
+        return self._load_groups().by_id.get(group_id)
+
+    def _enrich_groups(self) -> List[Dict[str, Any]]:
+        paths = self._config.paths
+
+        def build() -> List[Dict[str, Any]]:
+            return enrich_groups(load_group_payloads(paths.entities_dir))
+
+        signature = group_files_signature(paths.entities_dir)
+        if signature is None:
+            return build()
+        # Restarts and sibling workers reuse the enriched groups while the files are unchanged.
+        # The directory is part of the key because groups record their _source_path.
+        key = (ENRICHMENT_VERSION, str(paths.entities_dir), signature)
+        return load_or_build_cache(paths.enriched_cache_file, key, build)
+
+    def _reported_mask(
+        self, loaded: LoadedGroups
+    ) -> Tuple[Tuple[List[str], FrozenSet[str]], np.ndarray]:
+        """Return the reported ids and the matching mask over ``loaded``'s columns."""
+
+        cached = self._reported_mask_cache
+        if cached is None or cached[0] is not loaded or cached[1] is not self._reported_cache:
+            with self._reports_lock:
+                reported = self._reported()
+                cached = self._reported_mask_cache
+                if cached is None or cached[0] is not loaded or cached[1] is not reported:
+                    mask = np.isin(loaded.columns.group_ids, list(reported[1]))
+                    cached = self._reported_mask_cache = (loaded, reported, mask)
+        return cached[1], cached[2]
 
     def _load_summary(self) -> Dict[str, Any]:
         if self._summary_cache is None:
@@ -339,16 +850,17 @@ class GroupService:
             self._snapshots_cache = load_snapshots(self._config.paths.snapshots_file)
         return self._snapshots_cache
 
+    def _load_snapshot_index(self) -> SnapshotIndex:
+        if self._snapshot_index_cache is None:
+            self._snapshot_index_cache = SnapshotIndex.build(self._load_snapshots())
+        return self._snapshot_index_cache
+
     def _load_reports(self) -> List[Dict[str, Any]]:
         if self._reports_cache is None:
             ensure_reports_file(self._config.paths.reports_file)
             self._reports_cache = load_reports(self._config.paths.reports_file)
         return self._reports_cache
 
-    def _update_reports_cache(self, reports: List[Dict[str, Any]]) -> None:
-        self._reports_cache = reports
-        write_reports(self._config.paths.reports_file, reports)
-
     def get_settings(self) -> SettingsResponse:
         settings = self._config.settings
         return SettingsResponse(
@@ -359,9 +871,9 @@ class GroupService:
         )
 
     def get_dataset_summary(self) -> DatasetSummaryResponse:
-        groups = self._load_groups()
+        loaded = self._load_groups()
         summary_payload = self._load_summary()
-        aggregated = summarize_groups(groups)
+        aggregated = summarize_groups(loaded.columns)
         runs: List[RunOptionModel] = []
         if isinstance(summary_payload.get("runs"), list):
             for entry in summary_payload["runs"]:
@@ -379,34 +891,87 @@ class GroupService:
         return DatasetSummaryResponse(
             runs=runs,
             aggregated=aggregated,
-            total_groups=len(groups),
+            total_groups=len(loaded.groups),
             total_records=total_records if isinstance(total_records, int) else None,
             summary_metadata=summary_payload,
         )
 
-    def _reported_ids(self) -> List[str]:
-        return [entry.get("group_id") for entry in self._load_reports() if entry.get("group_id")]
+    def _encoded(self, key: str, build: Callable[[], Any]) -> EncodedPayload:
+        payload = self._encoded_payloads.get(key)
+        if payload is None:
+            generation = self._generation
+            payload = EncodedPayload.encode(build())
+            with self._encoded_lock:
+                if generation == self._generation:
+                    self._encoded_payloads[key] = payload
+        return payload
+
+    def get_settings_encoded(self) -> EncodedPayload:
+        return self._encoded("settings", self.get_settings)
+
+    def get_dataset_summary_encoded(self) -> EncodedPayload:
+        return self._encoded("summary", self.get_dataset_summary)
+
+    def list_snapshots_encoded(self, *, limit: int) -> EncodedPayload:
+        # Only the default page is kept: caching every requested limit would let
+        # clients fill memory with near-duplicate pages until the next refresh.
+        if limit != DEFAULT_SNAPSHOT_LIMIT:
+            return EncodedPayload.encode(self.list_snapshots(limit=limit))
+        return self._encoded("snapshots", lambda: self.list_snapshots(limit=limit))
 
-    def list_groups(self, filters: GroupFilters) -> GroupListResponse:
-        groups = self._load_groups()
-        reported_ids = self._reported_ids()
-        filtered = filter_groups(groups, filters=filters, reported_ids=reported_ids)
-        summaries = [
-            GroupSummary(
-                group_id=group.get("group_id"),
+    def _reported(self) -> Tuple[List[str], FrozenSet[str]]:
+        # Built and invalidated under the reports lock so a concurrent
+        # submission cannot leave a stale copy behind.
+        reported = self._reported_cache
+        if reported is None:
+            with self._reports_lock:
+                reported = self._reported_cache
+                if reported is None:
+                    ids = [entry.get("group_id") for entry in self._load_reports() if entry.get("group_id")]
+                    reported = self._reported_cache = (ids, frozenset(ids))
+        return reported
+
+    def _reported_set(self) -> FrozenSet[str]:
+        return self._reported()[1]
+
+    def _summary_blob(self, loaded: LoadedGroups, index: int, reported_set: FrozenSet[str]) -> bytes:
+        group = loaded.groups[index]
+        group_id = group.get("group_id")
+        prefix = loaded.summary_prefixes.get(index)
+        if prefix is None:
+            summary = GroupSummary(
+                group_id=group_id,
                 display_name=group.get("_display_name"),
-                metrics=GroupMetrics(**group["_metrics"]),
+                metrics=group["_metrics"],
                 source_path=group.get("_source_path"),
-                reported=group.get("group_id") in reported_ids,
+                reported=False,
             )
-            for group in filtered
-        ]
-        aggregated = summarize_groups(filtered)
-        return GroupListResponse(
-            items=summaries,
-            total=len(summaries),
-            aggregated=aggregated,
-            reported_ids=reported_ids,
+            # ``reported`` is the last key: cache the encoding up to its value
+            # so a new report does not invalidate the group's summary.
+            prefix = render_json(summary)[: -len(_REPORTED_FALSE)]
+            loaded.summary_prefixes[index] = prefix
+        return prefix + (_REPORTED_TRUE if group_id in reported_set else _REPORTED_FALSE)
+
+    def _network_fragment(self, loaded: LoadedGroups, index: int) -> Optional[NetworkFragment]:
+        if index not in loaded.network_fragments:
+            loaded.network_fragments[index] = build_network_fragment(loaded.groups[index])
+        return loaded.network_fragments[index]
+
+    def list_groups(self, filters: GroupFilters) -> bytes:
+        """Return the encoded ``GroupListResponse`` for ``filters``."""
+
+        loaded = self._load_groups()
+        (reported_ids, reported_set), mask = self._reported_mask(loaded)
+        indices = filter_groups(loaded.columns, filters=filters, reported=mask)
+        items = [self._summary_blob(loaded, index, reported_set) for index in indices.tolist()]
+        aggregated = summarize_groups(loaded.columns, indices)
+        return _encode_object(
+            [
+                ("items", _encode_array(items)),
+                ("total", render_json(len(items))),
+                ("aggregated", render_json(aggregated)),
+                ("reported_ids", render_json(reported_ids)),
+            ]
         )
 
     def get_group_detail(
@@ -415,21 +980,21 @@ class GroupService:
         *,
         transaction_filters: Optional[TransactionFilters] = None,
     ) -> GroupDetailResponse:
-        groups = self._load_groups()
-        target = next((g for g in groups if g.get("group_id") == group_id), None)
+        loaded = self._load_groups()
+        target = loaded.by_id.get(group_id)
         if not target:
             raise ValueError(f"Group {group_id} not found")
         tx_filters = transaction_filters or TransactionFilters()
-        filtered_transactions = self._apply_transaction_filters(target, tx_filters)
         group_model = GroupDetail(
             group_id=target.get("group_id"),
             display_name=target.get("_display_name"),
-            metrics=GroupMetrics(**target["_metrics"]),
+            metrics=target["_metrics"],
             source_path=target.get("_source_path"),
-            reported=target.get("group_id") in self._reported_ids(),
-            canonical_attributes=dict(target.get("canonical_attributes") or {}),
-            members=_convert_members(target.get("members") or []),
-            transactions=_convert_transactions(filtered_transactions),
+            reported=target.get("group_id") in self._reported_set(),
+            # Shared with the cached group, never mutated: embedded without a copy.
+            canonical_attributes=target.get("canonical_attributes") or {},
+            members=self._group_members(loaded, target),
+            transactions=self._apply_transaction_filters(target, tx_filters),
         )
         snapshots = self._select_relevant_snapshots(target)
         return GroupDetailResponse(
@@ -442,76 +1007,78 @@ class GroupService:
         self,
         group: Dict[str, Any],
         filters: TransactionFilters,
-    ) -> List[Dict[str, Any]]:
-        transactions = list(group.get("_transactions") or [])
-        filtered: List[Dict[str, Any]] = []
-        for tx in transactions:
-            amount = tx.get("amount")
-            if isinstance(amount, (int, float)):
-                amount_value = float(amount)
-            else:
-                amount_value = 0.0
-            if amount_value < filters.min_amount or amount_value > filters.max_amount:
-                continue
-            ts = tx.get("parsed_timestamp") or parse_iso_datetime(tx.get("timestamp"))
-            if filters.start_date and (not ts or ts < filters.start_date):
-                continue
-            if filters.end_date and (not ts or ts > filters.end_date):
-                continue
-            filtered.append(tx)
-        return filtered
+    ) -> List[TransactionModel]:
+        transactions = group.get("transactions") or []
+        timestamps = group["_tx_timestamps"]
+        indices = filter_transactions(group["_tx_arrays"], filters).tolist()
+        return _convert_transactions(
+            [transactions[index] for index in indices],
+            [timestamps[index] for index in indices],
+        )
+
+    def _group_members(self, loaded: LoadedGroups, group: Dict[str, Any]) -> List[MemberModel]:
+        # Member payloads do not depend on the request, so each group's are built once per load.
+        group_id = group.get("group_id")
+        members = loaded.member_payloads.get(group_id)
+        if members is None:
+            members = _convert_members(group.get("members") or [])
+            loaded.member_payloads[group_id] = members
+        return members
 
     def _select_relevant_snapshots(self, group: Dict[str, Any], limit: int = 25) -> List[Dict[str, Any]]:
         snapshots = self._load_snapshots()
         if not snapshots:
             return []
-        member_ids = {m.get("record_id") for m in group.get("members") or [] if m.get("record_id")}
-        signature_set = set()
-        for member in group.get("members") or []:
-            for signature in member.get("signature_history") or []:
-                signature_set.add(signature)
+        members = group.get("members") or []
+        member_ids = {m.get("record_id") for m in members if m.get("record_id")}
+        signatures = {
+            signature
+            for member in members
+            for signature in member.get("signature_history") or []
+            if signature is not None
+        }
         tax_id = group.get("canonical_attributes", {}).get("tax_id")
-        matched: List[Dict[str, Any]] = []
-        for snapshot in snapshots:
-            if not isinstance(snapshot, dict):
-                continue
-            if snapshot.get("record_id") in member_ids:
-                matched.append(snapshot)
-                continue
-            if snapshot.get("signature") in signature_set:
-                matched.append(snapshot)
-                continue
-            if tax_id and snapshot.get("normalized_attributes", {}).get("tax_id") == tax_id:
-                matched.append(snapshot)
-        return matched[:limit]
+        positions = self._load_snapshot_index().positions(member_ids, signatures, tax_id)
+        return [snapshots[position] for position in positions[:limit]]
 
     def get_network(
         self,
         filters: GroupFilters,
         *,
         highlight_reported: bool,
-    ) -> NetworkResponse:
-        groups = self._load_groups()
-        reported_ids = self._reported_ids()
-        filtered = filter_groups(groups, filters=filters, reported_ids=reported_ids)
+    ) -> Iterator[bytes]:
+        """Return the encoded ``NetworkResponse`` for ``filters`` as a chunk stream."""
+
+        loaded = self._load_groups()
+        (_, reported_set), mask = self._reported_mask(loaded)
+        indices = filter_groups(loaded.columns, filters=filters, reported=mask)
+        fragments = [
+            fragment for fragment in (self._network_fragment(loaded, index) for index in indices.tolist()) if fragment
+        ]
         return build_network_payload(
-            filtered,
-            reported_ids=reported_ids,
+            fragments,
+            reported_ids=reported_set,
             highlight_reported=highlight_reported,
         )
 
     def list_reports(self) -> List[ReportRecord]:
-        return [ReportRecord(**entry) for entry in self._load_reports() if isinstance(entry, dict)]
+        """Return the cached report records; callers must not mutate the list."""
+
+        records = self._report_records_cache
+        if records is None:
+            with self._reports_lock:
+                records = self._report_records_cache
+                if records is None:
+                    records = [_report_record(entry) for entry in self._load_reports() if isinstance(entry, dict)]
+                    self._report_records_cache = records
+        return records
 
     def submit_report(self, request: ReportCreateRequest) -> ReportCreateResponse:
         if not request.reason.strip():
             raise ValueError("A reason is required to record a report")
-        groups = self._load_groups()
-        target = next((g for g in groups if g.get("group_id") == request.group_id), None)
+        target = self._find_group(request.group_id)
         if not target:
             raise ValueError(f"Group {request.group_id} not found")
-        ensure_reports_file(self._config.paths.reports_file)
-        reports = self._load_reports()
         payload = {
             "timestamp": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
             "group_id": request.group_id,
@@ -523,31 +1090,82 @@ class GroupService:
                 "risk_score": target["_metrics"]["risk_score"],
             },
         }
-        updated_reports = reports + [payload]
-        self._update_reports_cache(updated_reports)
+        record = _report_record(payload)
+        with self._reports_lock:
+            reports = self._load_reports()
+            append_report(self._config.paths.reports_file, payload)
+            reports.append(payload)
+            if self._report_records_cache is not None:
+                self._report_records_cache.append(record)
+            total_reports = len(reports)
+            self._reported_cache = None
+            self._reported_mask_cache = None
         return ReportCreateResponse(
-            record=ReportRecord(**payload),
-            total_reports=len(updated_reports),
+            record=record,
+            total_reports=total_reports,
         )
 
     def refresh(self) -> None:
-        """Clear caches so subsequent calls pick up fresh artifacts."""
+        """Reload the group artifacts from disk and clear the derived caches.
+
+        Requests keep using the previous load until the new one is published.
+        """
+
+        with self._load_lock:
+            self._loaded = LoadedGroups.build(self._enrich_groups())
+            self._reported_cache = None
+            self._reported_mask_cache = None
+            self._summary_cache = None
+            self._snapshots_cache = None
+            self._snapshot_index_cache = None
+            self._reports_cache = None
+            self._report_records_cache = None
+            with self._encoded_lock:
+                self._encoded_payloads = {}
+                self._generation += 1
 
-        self._groups_cache = None
-        self._summary_cache = None
-        self._snapshots_cache = None
-        self._reports_cache = None
+    async def refresh_async(self) -> None:
+        """Run :meth:`refresh` off the event loop, coalescing concurrent callers.
+
+        A caller arriving while a refresh is in flight awaits that refresh
+        instead of starting another. The check-and-set below has no await in
+        between, so it is atomic on the event loop without a lock.
+        """
+
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(asyncio.to_thread(self.refresh))
+            self._refresh_task = task
+        # Shield so one client disconnecting does not cancel the shared reload.
+        await asyncio.shield(task)
 
     def list_snapshots(self, *, limit: int) -> SnapshotListResponse:
-        snapshots = self._load_snapshots()
-        limited = snapshots[:limit]
-        return SnapshotListResponse(items=limited, total=len(snapshots), limit=limit)
+        path = self._config.paths.snapshots_file
+        if self._snapshots_cache is None and path.suffix == ".jsonl":
+            # The listing only keeps the head of a JSONL export; leave the full
+            # load to the detail view, which has to match against every snapshot.
+            limited, total = load_snapshot_page(path, limit)
+        else:
+            snapshots = self._load_snapshots()
+            limited, total = snapshots[:limit], len(snapshots)
+        return SnapshotListResponse(items=limited, total=total, limit=limit)
+
+
+_SERVICE: Optional[GroupService] = None
+
+
+def init_service(config: Optional[AppConfig] = None) -> GroupService:
+    """Create the service and install it as the process-wide instance."""
+
+    global _SERVICE
+    _SERVICE = GroupService(config)
+    return _SERVICE
 
 
 def get_service() -> GroupService:
-    """Return a memoised service instance."""
+    """Return the service created at startup, creating it on first use."""
 
-    # Using a function attribute avoids module-level globals while keeping a warm cache.
-    if not hasattr(get_service, "_instance"):
-        get_service._instance = GroupService()  # type: ignore[attr-defined]
-    return get_service._instance  # type: ignore[attr-defined]
+    service = _SERVICE
+    if service is None:
+        service = init_service()
+    return service
@@ -0,0 +1,126 @@
+"""Static asset serving with precompressed variants."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import re
+import stat
+from pathlib import Path
+from typing import Callable, FrozenSet, List, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional; gzip still applies
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_SUFFIXES = frozenset({".js", ".css", ".json", ".svg"})
+MIN_COMPRESS_BYTES = 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Fingerprinted bundles such as ``app.3f2a9c1d.js`` never change in place.
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[^.]+$")
+
+
+def _encoders() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+    encoders: List[Tuple[str, Callable[[bytes], bytes]]] = []
+    if brotli is not None:
+        encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+    encoders.append((".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0)))
+    return encoders
+
+
+def precompress_assets(directory: Path) -> None:
+    """Write ``.br``/``.gz`` siblings for compressible assets that lack fresh ones."""
+
+    encoders = _encoders()
+    for path in directory.rglob("*"):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        source_stat = path.stat()
+        if source_stat.st_size <= MIN_COMPRESS_BYTES:
+            continue
+        data = None
+        for suffix, compress in encoders:
+            target = path.with_name(path.name + suffix)
+            if target.exists() and target.stat().st_mtime >= source_stat.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            # Per-process staging name: every server worker runs this at start-up.
+            staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            try:
+                staging.write_bytes(compress(data))
+                os.replace(staging, target)
+            except OSError:
+                logger.warning("Unable to write precompressed asset %s", target)
+                staging.unlink(missing_ok=True)
+
+
+def _accepted_encodings(header: str) -> FrozenSet[str]:
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        name, _, value = params.partition("=")
+        if name.strip() == "q":
+            try:
+                if float(value) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return frozenset(accepted)
+
+
+_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` that prefers ``.br``/``.gz`` siblings the client accepts."""
+
+    def _fresh_variant(self, path: str, accepted: FrozenSet[str]) -> Optional[Tuple[str, os.stat_result, str]]:
+        """Return the preferred accepted variant that is not older than its source."""
+
+        try:
+            _, source_stat = self.lookup_path(path)
+            if source_stat is None or not stat.S_ISREG(source_stat.st_mode):
+                return None
+            for encoding, suffix in _VARIANTS:
+                if encoding not in accepted:
+                    continue
+                full_path, variant_stat = self.lookup_path(path + suffix)
+                if variant_stat is None or not stat.S_ISREG(variant_stat.st_mode):
+                    continue
+                # An asset edited since the last precompress_assets() run is served uncompressed.
+                if variant_stat.st_mtime < source_stat.st_mtime:
+                    continue
+                return full_path, variant_stat, encoding
+        except OSError:
+            # Leave unreadable or invalid paths to StaticFiles' own error handling.
+            return None
+        return None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        response = None
+        if scope["method"] in ("GET", "HEAD") and any(encoding in accepted for encoding, _ in _VARIANTS):
+            variant = await anyio.to_thread.run_sync(self._fresh_variant, path, accepted)
+            if variant is not None:
+                full_path, variant_stat, encoding = variant
+                response = self.file_response(full_path, variant_stat, scope)
+                # mimetypes maps "app.js.br" to text/javascript, so only the encoding is added.
+                response.headers["Content-Encoding"] = encoding
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        if _HASHED_NAME.search(path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
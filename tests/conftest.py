@@ -0,0 +1,38 @@
+"""Shared fixtures: each test gets its own copy of the sample artifacts."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from aml_ui.config import AppConfig, AppPaths, AppSettings
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def make_config(base_dir: Path) -> AppConfig:
+    artifacts_dir = base_dir / "artifacts"
+    entities_dir = artifacts_dir / "entities"
+    paths = AppPaths(
+        base_dir=base_dir,
+        artifacts_dir=artifacts_dir,
+        entities_dir=entities_dir,
+        enriched_cache_file=entities_dir / ".enriched.pkl",
+        summary_file=artifacts_dir / "summary.json",
+        snapshots_file=artifacts_dir / "snapshots.json",
+        reports_file=base_dir / "reports.jsonl",
+        settings_file=base_dir / "config" / "app_settings.json",
+    )
+    return AppConfig(paths=paths, settings=AppSettings.from_payload({}))
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> AppConfig:
+    shutil.copytree(
+        REPO_ROOT / "artifacts",
+        tmp_path / "artifacts",
+        ignore=shutil.ignore_patterns(".enriched.pkl*"),
+    )
+    return make_config(tmp_path)
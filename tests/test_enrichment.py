@@ -0,0 +1,84 @@
+"""Tests for the batched timestamp parsing and metrics of ``enrich_groups``."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import numpy as np
+
+from aml_ui.data_access import parse_iso_datetime
+from aml_ui.services import enrich_groups
+
+UTC = timezone.utc
+
+
+def _group(group_id: str, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"group_id": group_id, "members": [], "transactions": transactions}
+
+
+def test_naive_timestamps_are_utc_next_to_offsets() -> None:
+    raw = [
+        "2024-01-01T10:00:00+02:00",
+        "2024-12-24T08:09:10.5",
+        "2024-03-01 12:00",
+        "2024-03-02",
+        "2024-03-03T00:00:00Z",
+    ]
+    # Offsets in one group, naive values in the next: both are parsed in the same batch.
+    groups = enrich_groups(
+        [
+            _group("offsets", [{"timestamp": raw[0]}]),
+            _group("naive", [{"timestamp": value} for value in raw[1:]]),
+        ]
+    )
+    parsed = groups[0]["_tx_timestamps"] + groups[1]["_tx_timestamps"]
+    assert parsed == [parse_iso_datetime(value) for value in raw]
+    assert parsed[1] == datetime(2024, 12, 24, 8, 9, 10, 500000, tzinfo=UTC)
+    assert groups[1]["_metrics"]["last_seen"] == datetime(2024, 12, 24, 8, 9, 10, 500000, tzinfo=UTC)
+
+
+def test_out_of_range_timestamps_keep_their_dates() -> None:
+    (group,) = enrich_groups(
+        [
+            _group(
+                "g",
+                [
+                    {"timestamp": "2024-06-01T00:00:00Z"},
+                    {"timestamp": "1500-06-01T00:00:00Z"},
+                    {"timestamp": "2999-01-01T12:00:00+00:00"},
+                    {"timestamp": "not a date"},
+                ],
+            )
+        ]
+    )
+    assert group["_tx_timestamps"] == [
+        datetime(2024, 6, 1, tzinfo=UTC),
+        datetime(1500, 6, 1, tzinfo=UTC),
+        datetime(2999, 1, 1, 12, tzinfo=UTC),
+        None,
+    ]
+    assert group["_metrics"]["first_seen"] == datetime(1500, 6, 1, tzinfo=UTC)
+    assert group["_metrics"]["last_seen"] == datetime(2999, 1, 1, 12, tzinfo=UTC)
+    # Clamped into the column in order, with only the unparseable row left as NaT.
+    column = group["_tx_arrays"].timestamp.view("int64")
+    assert column[1] < column[0] < column[2]
+    assert np.isnat(group["_tx_arrays"].timestamp[3])
+
+
+def test_mixed_counterparty_ids_are_counted() -> None:
+    (group,) = enrich_groups(
+        [
+            _group(
+                "g",
+                [
+                    {"counterparty_id": "c1"},
+                    {"counterparty_id": 7},
+                    {"counterparty_id": "c1"},
+                    {"counterparty_id": None},
+                    {"counterparty_id": ""},
+                ],
+            )
+        ]
+    )
+    assert group["_metrics"]["unique_counterparties"] == 2
@@ -0,0 +1,74 @@
+"""Tests for the on-disk cache of enriched groups."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+
+from aml_ui.config import AppConfig
+from aml_ui.data_access import group_files_signature
+from aml_ui.services import ENRICHMENT_VERSION, GroupFilters, GroupService
+
+
+def _list(service: GroupService, filters: GroupFilters = GroupFilters()) -> Dict[str, Any]:
+    return orjson.loads(service.list_groups(filters))
+
+
+def _entity_files(config: AppConfig) -> list:
+    return sorted(config.paths.entities_dir.glob("*.json"))
+
+
+def _rewrite_amounts(path: Path, amount: float) -> None:
+    payload = orjson.loads(path.read_bytes())
+    for tx in payload.get("transactions") or []:
+        tx["amount"] = amount
+    path.write_bytes(orjson.dumps(payload))
+    # Make sure the signature changes even on filesystems with coarse mtimes.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_changed_entity_files_invalidate_caches(config: AppConfig) -> None:
+    service = GroupService(config)
+    path = _entity_files(config)[0]
+    group_id = orjson.loads(path.read_bytes())["group_id"]
+    metrics = service.get_group_detail(group_id)["group"]["metrics"]
+    assert metrics["transaction_count"]
+    original = metrics["total_amount"]
+
+    _rewrite_amounts(path, 1.0)
+    # Cached until a refresh.
+    assert service.get_group_detail(group_id)["group"]["metrics"]["total_amount"] == original
+    service.refresh()
+    detail = service.get_group_detail(group_id)["group"]
+    assert detail["metrics"]["total_amount"] == detail["metrics"]["transaction_count"] * 1.0
+    listed = {item["group_id"]: item for item in _list(service)["items"]}
+    assert listed[group_id]["metrics"]["total_amount"] == detail["metrics"]["total_amount"]
+
+    # A restarted service does not pick up the enrichment pickled before the change.
+    _rewrite_amounts(path, 2.0)
+    restarted = GroupService(config)
+    assert restarted.get_group_detail(group_id)["group"]["metrics"]["total_amount"] == (
+        detail["metrics"]["transaction_count"] * 2.0
+    )
+
+
+def test_stale_enriched_cache_is_rejected(config: AppConfig) -> None:
+    paths = config.paths
+    signature = group_files_signature(paths.entities_dir)
+    stale_key = (ENRICHMENT_VERSION - 1, str(paths.entities_dir), signature)
+    with open(paths.enriched_cache_file, "wb") as handle:
+        pickle.dump(stale_key, handle)
+        pickle.dump([{"group_id": "stale", "_metrics": {}}], handle)
+
+    service = GroupService(config)
+    ids = {item["group_id"] for item in _list(service)["items"]}
+    assert "stale" not in ids
+    assert len(ids) == len(_entity_files(config))
+
+    with open(paths.enriched_cache_file, "rb") as handle:
+        assert pickle.load(handle) == (ENRICHMENT_VERSION, str(paths.entities_dir), signature)
@@ -0,0 +1,280 @@
+"""Column filters and summaries checked against the original per-group loops."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+import numpy as np
+
+from aml_ui.data_access import parse_iso_datetime
+from aml_ui.models import SummaryStats
+from aml_ui.services import (
+    GroupColumns,
+    GroupFilters,
+    TransactionFilters,
+    enrich_groups,
+    filter_groups,
+    filter_transactions,
+    summarize_groups,
+)
+
+_BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(rng: random.Random) -> Optional[str]:
+    choice = rng.random()
+    if choice < 0.1:
+        return None
+    if choice < 0.15:
+        return "not a date"
+    value = _BASE + timedelta(days=rng.randrange(0, 365), seconds=rng.randrange(0, 86400))
+    if choice < 0.3:
+        # Offsets and naive values are both read as instants in UTC.
+        return value.astimezone(timezone(timedelta(hours=2))).isoformat()
+    if choice < 0.4:
+        return value.replace(tzinfo=None, microsecond=rng.randrange(0, 10**6)).isoformat()
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _amount(rng: random.Random) -> Any:
+    choice = rng.random()
+    if choice < 0.1:
+        return None
+    if choice < 0.15:
+        return "12.5"
+    if choice < 0.5:
+        return rng.randrange(0, 20) * 500
+    return round(rng.uniform(-50, 25_000), 2)
+
+
+def make_raw_groups(seed: int = 7, count: int = 60) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    groups = []
+    for index in range(count):
+        transactions = [
+            {
+                "amount": _amount(rng),
+                "direction": rng.choice(["in", "out", "OUT", "credit", "debit", None]),
+                "counterparty_id": rng.choice(["c1", "c2", "c3", None]),
+                "timestamp": _timestamp(rng),
+            }
+            for _ in range(rng.randrange(0, 7))
+        ]
+        groups.append(
+            {
+                "group_id": f"g{index}",
+                "members": [{"record_id": f"r{index}_{n}"} for n in range(rng.randrange(1, 4))],
+                "transactions": transactions,
+            }
+        )
+    return groups
+
+
+def reference_filter(
+    groups: Sequence[Dict[str, Any]], filters: GroupFilters, reported_set: FrozenSet[str]
+) -> List[int]:
+    """The original ``filter_groups`` loop, returning row positions."""
+
+    matched = []
+    for position, group in enumerate(groups):
+        metrics = group["_metrics"]
+        if metrics["risk_score"] < filters.min_risk:
+            continue
+        total_amount = metrics["total_amount"]
+        if total_amount < filters.min_total or total_amount > filters.max_total:
+            continue
+        if filters.reported_only and group.get("group_id") not in reported_set:
+            continue
+        if filters.start_date or filters.end_date:
+            group_start = metrics.get("first_seen")
+            group_end = metrics.get("last_seen")
+            if filters.start_date and (not group_end or group_end < filters.start_date):
+                continue
+            if filters.end_date and (not group_start or group_start > filters.end_date):
+                continue
+        matched.append(position)
+    return matched
+
+
+def reference_summary(groups: Sequence[Dict[str, Any]]) -> SummaryStats:
+    """The original ``summarize_groups`` loop."""
+
+    if not groups:
+        return SummaryStats(
+            min_total_amount=None,
+            max_total_amount=None,
+            min_risk=None,
+            max_risk=None,
+            min_date=None,
+            max_date=None,
+            min_tx_amount=None,
+            max_tx_amount=None,
+        )
+    metrics = [group["_metrics"] for group in groups]
+    tx_min = [float(m["min_transaction_amount"]) for m in metrics if m["min_transaction_amount"] is not None]
+    tx_max = [float(m["max_transaction_amount"]) for m in metrics if m["max_transaction_amount"] is not None]
+    dates = [m[key] for m in metrics for key in ("first_seen", "last_seen") if m[key]]
+    return SummaryStats(
+        min_total_amount=min(m["total_amount"] for m in metrics),
+        max_total_amount=max(m["total_amount"] for m in metrics),
+        min_risk=min(m["risk_score"] for m in metrics),
+        max_risk=max(m["risk_score"] for m in metrics),
+        min_date=min(dates) if dates else None,
+        max_date=max(dates) if dates else None,
+        min_tx_amount=min(tx_min) if tx_min else None,
+        max_tx_amount=max(tx_max) if tx_max else None,
+    )
+
+
+def reference_transactions(transactions: Sequence[Dict[str, Any]], filters: TransactionFilters) -> List[int]:
+    """The original ``_apply_transaction_filters`` loop, returning row positions."""
+
+    matched = []
+    for position, tx in enumerate(transactions):
+        amount = tx.get("amount")
+        amount_value = float(amount) if isinstance(amount, (int, float)) else 0.0
+        if amount_value < filters.min_amount or amount_value > filters.max_amount:
+            continue
+        ts = parse_iso_datetime(tx.get("timestamp"))
+        if filters.start_date and (not ts or ts < filters.start_date):
+            continue
+        if filters.end_date and (not ts or ts > filters.end_date):
+            continue
+        matched.append(position)
+    return matched
+
+
+def group_filter_grid(groups: Sequence[Dict[str, Any]]) -> List[GroupFilters]:
+    metrics = [group["_metrics"] for group in groups]
+    risks = sorted({m["risk_score"] for m in metrics})
+    totals = sorted({m["total_amount"] for m in metrics})
+    seen = sorted({m[key] for m in metrics for key in ("first_seen", "last_seen") if m[key]})
+    # Values taken from the data make every bound hit rows exactly on it.
+    dates = [None, seen[0], seen[len(seen) // 2], seen[-1], seen[-1] + timedelta(days=1)]
+    return [
+        GroupFilters(
+            min_risk=min_risk,
+            min_total=min_total,
+            max_total=max_total,
+            start_date=start_date,
+            end_date=end_date,
+            reported_only=reported_only,
+        )
+        for min_risk, min_total, max_total, start_date, end_date, reported_only in itertools.product(
+            [0, risks[len(risks) // 2], risks[-1]],
+            [0.0, totals[len(totals) // 3]],
+            [float("inf"), totals[2 * len(totals) // 3], totals[0]],
+            dates,
+            dates,
+            [False, True],
+        )
+    ]
+
+
+def test_filter_groups_matches_reference() -> None:
+    groups = enrich_groups(make_raw_groups())
+    columns = GroupColumns.from_groups(groups)
+    reported_set = frozenset(group["group_id"] for group in groups[::4])
+    reported = np.isin(columns.group_ids, list(reported_set))
+    for filters in group_filter_grid(groups):
+        indices = filter_groups(columns, filters=filters, reported=reported)
+        assert indices.tolist() == reference_filter(groups, filters, reported_set), filters
+
+
+def test_filter_groups_leaves_reported_mask_untouched() -> None:
+    groups = enrich_groups(make_raw_groups())
+    columns = GroupColumns.from_groups(groups)
+    reported = np.ones(len(groups), dtype=bool)
+    # The reported mask comes first here, so combining must not write into it.
+    filters = GroupFilters(reported_only=True, start_date=_BASE + timedelta(days=3650))
+    assert filter_groups(columns, filters=filters, reported=reported).size == 0
+    assert reported.all()
+
+
+def test_summarize_groups_matches_reference() -> None:
+    groups = enrich_groups(make_raw_groups())
+    columns = GroupColumns.from_groups(groups)
+    reported = np.zeros(len(groups), dtype=bool)
+    assert summarize_groups(columns) == reference_summary(groups)
+    for filters in group_filter_grid(groups):
+        indices = filter_groups(columns, filters=filters, reported=reported)
+        expected = reference_summary([groups[index] for index in indices.tolist()])
+        assert summarize_groups(columns, indices) == expected, filters
+
+
+def test_summarize_groups_without_rows_or_dates() -> None:
+    groups = enrich_groups([{"group_id": "g0", "members": [], "transactions": [{"amount": None}]}])
+    columns = GroupColumns.from_groups(groups)
+    assert summarize_groups(columns) == reference_summary(groups)
+    assert summarize_groups(columns)["min_date"] is None
+    empty = np.array([], dtype=np.intp)
+    assert summarize_groups(columns, empty) == reference_summary([])
+    assert summarize_groups(GroupColumns.from_groups([])) == reference_summary([])
+
+
+def test_filter_transactions_matches_reference() -> None:
+    groups = enrich_groups(make_raw_groups())
+    transactions = [tx for group in groups for tx in group["transactions"]]
+    amounts = sorted({float(tx["amount"]) for tx in transactions if isinstance(tx["amount"], (int, float))})
+    stamps = sorted({ts for ts in map(parse_iso_datetime, (tx["timestamp"] for tx in transactions)) if ts})
+    dates = [None, stamps[0], stamps[len(stamps) // 2], stamps[-1]]
+    grid = [
+        TransactionFilters(min_amount=min_amount, max_amount=max_amount, start_date=start_date, end_date=end_date)
+        for min_amount, max_amount, start_date, end_date in itertools.product(
+            [0.0, -100.0, amounts[len(amounts) // 2]],
+            [float("inf"), amounts[len(amounts) // 2], 0.0],
+            dates,
+            dates,
+        )
+    ]
+    for group in groups:
+        for filters in grid:
+            indices = filter_transactions(group["_tx_arrays"], filters)
+            expected = reference_transactions(group["transactions"], filters)
+            assert indices.tolist() == expected, (group["group_id"], filters)
+
+
+# Outside datetime64[ns]; one per side, since values beyond the range are clamped together.
+_OUT_OF_RANGE = ("1500-06-01T00:00:00Z", "2999-01-01T12:00:00+00:00")
+
+
+def make_out_of_range_groups() -> List[Dict[str, Any]]:
+    raw = make_raw_groups(seed=11)
+    for index, group in enumerate(raw[::5]):
+        if group["transactions"]:
+            group["transactions"][0]["timestamp"] = _OUT_OF_RANGE[index % 2]
+    return raw
+
+
+def test_seen_bounds_match_parsed_timestamps() -> None:
+    groups = enrich_groups(make_out_of_range_groups())
+    seen = [group["_metrics"]["first_seen"] for group in groups] + [group["_metrics"]["last_seen"] for group in groups]
+    assert {ts.year for ts in seen if ts} >= {1500, 2999}
+    for group in groups:
+        stamps = [ts for ts in map(parse_iso_datetime, (tx["timestamp"] for tx in group["transactions"])) if ts]
+        assert group["_metrics"]["first_seen"] == (min(stamps) if stamps else None)
+        assert group["_metrics"]["last_seen"] == (max(stamps) if stamps else None)
+
+
+def test_date_bounds_match_reference_outside_datetime64_range() -> None:
+    groups = enrich_groups(make_out_of_range_groups())
+    columns = GroupColumns.from_groups(groups)
+    reported = np.zeros(len(groups), dtype=bool)
+    seen = sorted({m[key] for m in (g["_metrics"] for g in groups) for key in ("first_seen", "last_seen") if m[key]})
+    middle = seen[len(seen) // 2]
+    # Bounds beyond the data only on the side where clamping cannot reorder them.
+    starts = [None, datetime(1, 1, 1, tzinfo=timezone.utc), seen[0], middle, seen[-1]]
+    ends = [None, seen[0], middle, seen[-1], datetime(9999, 12, 31, tzinfo=timezone.utc)]
+    for start_date, end_date in itertools.product(starts, ends):
+        filters = GroupFilters(start_date=start_date, end_date=end_date)
+        indices = filter_groups(columns, filters=filters, reported=reported)
+        assert indices.tolist() == reference_filter(groups, filters, frozenset()), filters
+        expected = reference_summary([groups[index] for index in indices.tolist()])
+        assert summarize_groups(columns, indices) == expected, filters
+        tx_filters = TransactionFilters(start_date=start_date, end_date=end_date)
+        for group in groups:
+            rows = filter_transactions(group["_tx_arrays"], tx_filters).tolist()
+            assert rows == reference_transactions(group["transactions"], tx_filters), (group["group_id"], tx_filters)
@@ -0,0 +1,72 @@
+"""Tests for the report log and the reported flags it drives."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import orjson
+
+from aml_ui.config import AppConfig
+from aml_ui.data_access import ensure_reports_file, load_reports
+from aml_ui.models import ReportCreateRequest
+from aml_ui.services import GroupFilters, GroupService
+
+
+def _list(service: GroupService, filters: GroupFilters = GroupFilters()) -> Dict[str, Any]:
+    return orjson.loads(service.list_groups(filters))
+
+
+def test_submit_report_then_list_groups(config: AppConfig) -> None:
+    service = GroupService(config)
+    before = _list(service)
+    assert not any(item["reported"] for item in before["items"])
+    assert _list(service, GroupFilters(reported_only=True))["items"] == []
+
+    group_id = before["items"][0]["group_id"]
+    response = service.submit_report(ReportCreateRequest(group_id=group_id, reason="circular flow"))
+    assert response["total_reports"] == 1
+
+    reported = _list(service, GroupFilters(reported_only=True))
+    assert [item["group_id"] for item in reported["items"]] == [group_id]
+    assert reported["items"][0]["reported"] is True
+    assert reported["reported_ids"] == [group_id]
+    after = _list(service)
+    assert {item["group_id"] for item in after["items"] if item["reported"]} == {group_id}
+    assert service.get_group_detail(group_id)["group"]["reported"] is True
+
+    # The log is re-read after a refresh.
+    service.refresh()
+    assert _list(service, GroupFilters(reported_only=True))["reported_ids"] == [group_id]
+
+
+def test_submitted_reports_are_appended_to_the_log(config: AppConfig) -> None:
+    service = GroupService(config)
+    group_ids = [item["group_id"] for item in _list(service)["items"][:2]]
+    for group_id in group_ids:
+        service.submit_report(ReportCreateRequest(group_id=group_id, reason="structuring", checks=["velocity"]))
+
+    lines = config.paths.reports_file.read_bytes().splitlines()
+    assert [orjson.loads(line)["group_id"] for line in lines] == group_ids
+    assert [record["group_id"] for record in GroupService(config).list_reports()] == group_ids
+
+
+def test_empty_log_is_seeded_from_legacy_reports(config: AppConfig) -> None:
+    log = config.paths.reports_file
+    legacy = [{"group_id": "111223333_0", "reason": "legacy"}]
+    log.with_suffix(".json").write_bytes(orjson.dumps(legacy))
+    log.write_bytes(b"")
+
+    ensure_reports_file(log)
+    assert load_reports(log) == legacy
+    # A log that already has records is left alone.
+    log.with_suffix(".json").write_bytes(orjson.dumps(legacy * 2))
+    ensure_reports_file(log)
+    assert load_reports(log) == legacy
+    assert _list(GroupService(config), GroupFilters(reported_only=True))["reported_ids"] == ["111223333_0"]
+
+
+def test_missing_log_is_created(config: AppConfig) -> None:
+    log = config.paths.reports_file
+    assert not log.exists()
+    ensure_reports_file(log)
+    assert log.read_bytes() == b""
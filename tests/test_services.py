@@ -0,0 +1,142 @@
+"""Tests for the caching and reload behaviour of :class:`GroupService`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+import pytest
+
+from aml_ui.config import AppConfig
+from aml_ui.services import GroupFilters, GroupService
+
+
+def _list(service: GroupService, filters: GroupFilters = GroupFilters()) -> Dict[str, Any]:
+    return orjson.loads(service.list_groups(filters))
+
+
+def _entity_files(config: AppConfig) -> list:
+    return sorted(config.paths.entities_dir.glob("*.json"))
+
+
+def _write_group(directory: Path, name: str, group_id: Any, counterparty: str, amount: float) -> None:
+    payload = {
+        "group_id": group_id,
+        "canonical_attributes": {"name": counterparty.lower()},
+        "members": [],
+        "transactions": [
+            {
+                "amount": amount,
+                "direction": "out",
+                "counterparty_id": counterparty,
+                "timestamp": "2024-01-01T00:00:00Z",
+            }
+        ],
+    }
+    (directory / name).write_bytes(orjson.dumps(payload))
+
+
+def test_groups_sharing_an_id_keep_their_own_payloads(config: AppConfig) -> None:
+    entities_dir = config.paths.entities_dir
+    for path in _entity_files(config):
+        path.unlink()
+    _write_group(entities_dir, "a_0.json", "G1", "C1", 10.0)
+    _write_group(entities_dir, "a_1.json", "G1", "C2", 30.0)
+    _write_group(entities_dir, "b_0.json", None, "C3", 50.0)
+    _write_group(entities_dir, "b_1.json", None, "C4", 70.0)
+    service = GroupService(config)
+
+    items = _list(service)["items"]
+    assert len(items) == 4
+    totals = {Path(item["source_path"]).name: item["metrics"]["total_amount"] for item in items}
+    assert totals == {"a_0.json": 10.0, "a_1.json": 30.0, "b_0.json": 50.0, "b_1.json": 70.0}
+
+    network = orjson.loads(b"".join(service.get_network(GroupFilters(), highlight_reported=True)))
+    edges = {(edge["source"], edge["target"]): (edge["amount"], edge["count"]) for edge in network["edges"]}
+    assert edges == {("G1", "C1"): (10.0, 1), ("G1", "C2"): (30.0, 1)}
+
+
+def test_refresh_concurrent_with_list_groups(config: AppConfig) -> None:
+    service = GroupService(config)
+    files = _entity_files(config)
+    removed = files[0]
+    content = removed.read_bytes()
+    stop = threading.Event()
+    errors: list = []
+
+    def reload_repeatedly() -> None:
+        # Alternate the group count so positions from one load never fit another.
+        try:
+            for round_ in range(10):
+                if round_ % 2:
+                    removed.write_bytes(content)
+                else:
+                    removed.unlink()
+                service.refresh()
+        except Exception as exc:  # noqa: BLE001 - surfaced by the assertion below
+            errors.append(exc)
+        finally:
+            stop.set()
+
+    _list(service)
+    worker = threading.Thread(target=reload_repeatedly)
+    worker.start()
+    try:
+        while not stop.is_set():
+            payload = _list(service, GroupFilters(min_risk=1))
+            assert payload["total"] == len(payload["items"])
+            assert len(payload["items"]) in (len(files) - 1, len(files))
+            b"".join(service.get_network(GroupFilters(), highlight_reported=True))
+    finally:
+        worker.join()
+    assert not errors
+    assert _list(service)["total"] == len(files)
+
+
+def test_refresh_async_coalesces_concurrent_callers(config: AppConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    service = GroupService(config)
+    reload = service.refresh
+    started = threading.Event()
+    release = threading.Event()
+    calls: list = []
+
+    def slow_refresh() -> None:
+        calls.append(None)
+        started.set()
+        assert release.wait(5)
+        reload()
+
+    monkeypatch.setattr(service, "refresh", slow_refresh)
+
+    async def run() -> None:
+        first = asyncio.ensure_future(service.refresh_async())
+        assert await asyncio.to_thread(started.wait, 5)
+        # Callers arriving mid-reload join it; one disconnecting does not cancel it.
+        joined = [asyncio.ensure_future(service.refresh_async()) for _ in range(5)]
+        await asyncio.sleep(0)
+        joined[0].cancel()
+        release.set()
+        await asyncio.gather(first, *joined[1:])
+        assert len(calls) == 1
+        # A caller arriving after the reload finished starts a new one.
+        await service.refresh_async()
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_snapshot_total_ignores_unparsed_lines(config: AppConfig) -> None:
+    path = config.paths.artifacts_dir / "snapshots.jsonl"
+    path.write_bytes(b'{"record_id": "r1"}\nnot json\n\n[1, 2]\n{"record_id": "r2"}\n{"record_id": "r3"}\n')
+    service = GroupService(replace(config, paths=replace(config.paths, snapshots_file=path)))
+
+    page = service.list_snapshots(limit=2)
+    assert [item["record_id"] for item in page["items"]] == ["r1", "r2"]
+    assert page["total"] == 3
+    # The same total once the detail view has loaded every snapshot.
+    service.get_group_detail(_list(service)["items"][0]["group_id"])
+    assert service.list_snapshots(limit=2) == page